@@ -5,6 +5,7 @@ from ....services.google_drive import GoogleDriveService
 from ....core.auth import get_current_user
 from ....core.config import settings
 from datetime import datetime
+import time
 
 router = APIRouter()
 
@@ -82,19 +83,19 @@ async def check_cache(
                 "message": "No cache entry found"
             }
             
-        # Calculate time until expiry
-        now = datetime.utcnow()
-        last_scan = cache_entry['last_scan']
-        ttl = scan_cache.cache_ttl
+        # Calculate time until expiry (cache timestamps are epoch floats)
+        now = time.time()
+        last_scan = cache_entry.last_scan
+        ttl = scan_cache.cache_ttl.total_seconds()
         expires_at = last_scan + ttl if last_scan else None
-        time_until_expiry = (expires_at - now).total_seconds() if expires_at and expires_at > now else 0
-        
+        time_until_expiry = expires_at - now if expires_at and expires_at > now else 0
+
         return {
             "cached": True,
-            "last_scan": last_scan.isoformat() if last_scan else None,
-            "expires_at": expires_at.isoformat() if expires_at else None,
+            "last_scan": datetime.utcfromtimestamp(last_scan).isoformat() if last_scan else None,
+            "expires_at": datetime.utcfromtimestamp(expires_at).isoformat() if expires_at else None,
             "time_until_expiry_seconds": time_until_expiry if time_until_expiry > 0 else 0,
-            "data": cache_entry['data']
+            "data": cache_entry.payload()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
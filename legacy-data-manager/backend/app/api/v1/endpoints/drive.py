@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from ....services.google_drive import GoogleDriveService
 from ....core.config import settings
 import logging
+from itertools import chain
 from datetime import datetime, timezone, timedelta
 import json
 import uuid
@@ -748,11 +749,9 @@ async def set_file_department(
         logger.info(f"Set file {file_id} department to {department_id} in persistent store.")
         
         # 2. ⚡ CACHE UPDATE (For real-time views):
-        cached_dirs = scan_cache.get_cached_directories()
-        
         file_found = False
-        # Check both drive-wide and directory caches
-        for dir_id in ['drive'] + cached_dirs:
+        # Check both drive-wide and directory caches (lazy view: no list copy)
+        for dir_id in chain(('drive',), scan_cache.iter_cached_directories()):
             cached_result = scan_cache.get_cached_result(dir_id)
             if cached_result and "files" in cached_result:
                 for i, file in enumerate(cached_result["files"]):
@@ -777,7 +776,14 @@ async def set_file_department(
                             stats["by_department"][department_id] = 0
                         stats["by_department"][department_id] += 1
                         
-                        scan_cache.update_cache(dir_id, cached_result)
+                        # Metadata-only rewrite: keep the entry's original
+                        # timestamp so a department edit doesn't extend the
+                        # scan TTL and keep stale scan data alive.
+                        entry = scan_cache.get_cache_entry(dir_id)
+                        scan_cache.update_cache(
+                            dir_id, cached_result,
+                            last_scan=entry.last_scan if entry else None
+                        )
                         file_found = True
                         break
                 
@@ -814,12 +820,9 @@ async def list_department_files(
     and returns files matching the department filter, deduplicated by file ID.
     """
     try:
-        # Get all cached directories
-        cached_dirs = scan_cache.get_cached_directories()
-        
         # Collect files from all caches (drive-wide and specific directories)
         department_files = []
-        for dir_id in ['drive'] + cached_dirs:
+        for dir_id in chain(('drive',), scan_cache.iter_cached_directories()):
             cached_result = scan_cache.get_cached_result(dir_id)
             if cached_result and "files" in cached_result:
                 # Use shared filter function - filter by department only
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
-from ....services.slack_service import SlackService
+import orjson
+from ....services.slack_service import SlackService, SlackMessageTemplates
 from ....services.chat_service import ChatService
 from ....services.google_drive import GoogleDriveService
 from ....db.database import get_db
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 import json
 import hmac
@@ -17,6 +19,18 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Shared immutable response templates get their JSON bodies encoded once
+# at import time and written straight to the wire. Keyed by object id:
+# the templates live for the process lifetime, so identity is stable.
+_STATIC_BODIES = {
+    id(template): orjson.dumps(template)
+    for template in (
+        SlackMessageTemplates.help_message(),
+        SlackService._AUTH_ERROR_RESPONSE,
+        SlackService._CONNECT_OK_RESPONSE,
+    )
+}
+
 def get_slack_service(db: Session = Depends(get_db)) -> SlackService:
     """
     Get SlackService instance.
@@ -93,7 +107,9 @@ async def verify_slack_signature(request: Request, body_str: str = None) -> bool
         logger.error(f"Error verifying Slack signature: {str(e)}", exc_info=True)
         return False
 
-@router.post("/events")
+# orjson serializes the nested block payloads several times faster
+# than the default json encoder, which matters under command bursts.
+@router.post("/events", response_class=ORJSONResponse)
 async def handle_slack_events(request: Request, slack_service: SlackService = Depends(get_slack_service)):
     """Handle incoming Slack events"""
     try:
@@ -143,8 +159,8 @@ async def handle_slack_events(request: Request, slack_service: SlackService = De
             content={"error": f"Internal server error: {str(e)}"}
         )
 
-@router.post("/commands")
-@router.get("/commands")
+@router.post("/commands", response_class=ORJSONResponse)
+@router.get("/commands", response_class=ORJSONResponse)
 async def handle_slack_commands(request: Request, slack_service: SlackService = Depends(get_slack_service)):
     """Handle incoming Slack slash commands"""
     try:
@@ -202,6 +218,10 @@ async def handle_slack_commands(request: Request, slack_service: SlackService =
         
         # Process other commands
         response = await slack_service.handle_slash_command(form_dict)
+        static_body = _STATIC_BODIES.get(id(response))
+        if static_body is not None:
+            # Shared static payload: skip serialization entirely
+            return Response(content=static_body, media_type="application/json")
         return response
         
     except Exception as e:
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.sqlite import JSON
@@ -72,6 +72,12 @@ class SlackLinkingAudit(Base):
 class UserActivity(Base):
     """Comprehensive audit log for all user activities"""
     __tablename__ = "user_activities"
+    # Composite index for the per-user listing/stats reads, which filter on
+    # user_id and order/filter by created_at; the single-column indexes
+    # can't satisfy that without a sort.
+    __table_args__ = (
+        Index('ix_user_activities_user_created', 'user_id', 'created_at'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
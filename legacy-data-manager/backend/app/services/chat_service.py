@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 from .google_drive import GoogleDriveService
 from .scan_cache_service import ScanCacheService
 from .file_scanner_with_json import scan_files
@@ -7,12 +8,34 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Percent-of-storage factors, precomputed so the hot stats paths do a
+# single multiply instead of re-deriving the divisor each call.
+# get_drive_stats assumes 1GB total storage; the per-file-list helper
+# assumes the 15GB Google Drive free tier.
+_PCT_PER_BYTE_1GB = 100 / (1024 * 1024 * 1024)
+_PCT_PER_BYTE_15GB = 100 / (15 * 1024 * 1024 * 1024)
+
+# How long a computed drive-stats snapshot stays fresh. Slack users issue
+# bursty command sequences (status, then hot, then suggest) that would
+# otherwise recompute identical stats over the same file listing.
+_DRIVE_STATS_TTL = 30.0
+
+# How long a directory name→id mapping learned from a list call stays
+# usable for resolving scan-by-name without refetching the listing.
+_NAME_TO_ID_TTL = 300.0
+
 class ChatService:
     def __init__(self, drive_service: GoogleDriveService):
         self.drive_service = drive_service
         # Use per-user cache if user_id is available, otherwise use global cache (legacy mode)
         user_id = drive_service.user_id if hasattr(drive_service, 'user_id') and drive_service.user_id else None
         self.scan_cache = ScanCacheService(user_id=user_id)
+        # Memoized (stats, computed_at) from get_drive_stats; instances are
+        # per-user, so no extra cache key is needed.
+        self._drive_stats_cache: Optional[Tuple[Dict, float]] = None
+        # {lowered directory name: (directory_id, cached_at)}, filled by
+        # _handle_list and consulted by lookup_directory_id.
+        self._name_to_id_cache: Dict[str, Tuple[str, float]] = {}
         self.commands = {
             "help": self._handle_help,
             "list": self._handle_list,
@@ -98,8 +121,12 @@ Try any of these commands!"""
                     "content": "No directories found in your drive."
                 }
             
+            # Remember the name→id pairs so scan-by-name can resolve
+            # without refetching this listing.
+            now = time.time()
             response = "Available Directories 📁\n\n"
             for directory in directories:
+                self._name_to_id_cache[directory['name'].lower().strip()] = (directory['id'], now)
                 response += f"- {directory['name']} (ID: {directory['id']})\n"
             
             return {
@@ -113,6 +140,14 @@ Try any of these commands!"""
                 "content": f"Sorry, I encountered an error: {str(e)}"
             }
 
+    def lookup_directory_id(self, name: str) -> Optional[str]:
+        """Resolve a lowered directory name to its ID from the cache
+        populated by _handle_list, or None if unknown or stale."""
+        cached = self._name_to_id_cache.get(name)
+        if cached is not None and time.time() - cached[1] < _NAME_TO_ID_TTL:
+            return cached[0]
+        return None
+
     async def _handle_inactive(self, _: str) -> Dict:
         """Handle the inactive command."""
         if not self.drive_service.is_authenticated():
@@ -249,16 +284,21 @@ Try any of these commands!"""
                     "content": f"Could not find or categorize folder with ID '{folder_id}'. It might be empty or inaccessible."
                 }
 
-            response = f"Summary for folder ID {folder_id}:\n"
-            response += f"- Total Files: {summary.get('total_files', 0)}\n"
-            response += f"- Total Size: {summary.get('total_size', 0)} bytes\n"
-            response += "- Files by Type:\n"
-            for type_name, count in summary.get('by_type', {}).items():
-                if count > 0:
-                    response += f"    - {type_name.capitalize()}: {count}\n"
-            response += f"- Recent Files (last 30 days): {summary.get('recent_files', 0)}\n"
-            response += f"- Large Files (>10MB): {summary.get('large_files', 0)}\n"
-            response += f"- Number of Owners: {summary.get('owners', 0)}\n"
+            # by_type is pre-filtered to nonzero counts at aggregation time,
+            # so rendering is a straight format-and-join.
+            by_type_lines = "".join(
+                f"    - {type_name.capitalize()}: {count}\n"
+                for type_name, count in summary.get('by_type', {}).items()
+            )
+            response = (
+                f"Summary for folder ID {folder_id}:\n"
+                f"- Total Files: {summary.get('total_files', 0)}\n"
+                f"- Total Size: {summary.get('total_size', 0)} bytes\n"
+                f"- Files by Type:\n{by_type_lines}"
+                f"- Recent Files (last 30 days): {summary.get('recent_files', 0)}\n"
+                f"- Large Files (>10MB): {summary.get('large_files', 0)}\n"
+                f"- Number of Owners: {summary.get('owners', 0)}\n"
+            )
             
             return {
                 "type": "text",
@@ -293,7 +333,12 @@ Try any of these commands!"""
         }
 
     async def get_drive_stats(self) -> Dict:
-        """Get overall drive statistics."""
+        """Get overall drive statistics (memoized for a short window)."""
+        cached = self._drive_stats_cache
+        if cached is not None and time.time() - cached[1] < _DRIVE_STATS_TTL:
+            logger.debug("Using memoized drive stats")
+            return cached[0]
+
         logger.info("Starting get_drive_stats")
         if not await self.drive_service.is_authenticated():
             logger.error("Not authenticated with Google Drive")
@@ -331,7 +376,7 @@ Try any of these commands!"""
                     sensitive_files += 1
             
             # Calculate storage usage percentage (placeholder - implement actual calculation)
-            storage_used_percentage = min((total_size / (1024 * 1024 * 1024)) * 100, 100)  # Assuming 1GB total storage
+            storage_used_percentage = min(total_size * _PCT_PER_BYTE_1GB, 100)
             
             stats = {
                 'total_files': total_files,
@@ -340,6 +385,7 @@ Try any of these commands!"""
                 'storage_used_percentage': storage_used_percentage
             }
             logger.info(f"Calculated stats: {stats}")
+            self._drive_stats_cache = (stats, time.time())
             return stats
         except Exception as e:
             logger.error(f"Error getting drive stats: {str(e)}", exc_info=True)
@@ -372,9 +418,7 @@ Try any of these commands!"""
     def _calculate_storage_percentage(self, files: List[Dict]) -> float:
         """Calculate storage usage percentage."""
         total_size = sum(int(f.get('size', 0)) for f in files)
-        # Assuming 15GB free tier limit for Google Drive
-        storage_limit = 15 * 1024 * 1024 * 1024  
-        return min(round((total_size / storage_limit) * 100, 2), 100)
+        return min(round(total_size * _PCT_PER_BYTE_15GB, 2), 100)
 
     def _is_old_file(self, file: Dict) -> bool:
         """Check if a file is older than 3 years."""
@@ -382,12 +426,17 @@ Try any of these commands!"""
         return (datetime.utcnow() - modified_time).days > 1095  # 3 years in days
 
     def _summarize_file_types(self, results: Dict) -> Dict:
-        """Summarize file types across all age categories."""
+        """
+        Summarize file types across all age categories.
+        Zero-count types are dropped here, so consumers can format the
+        result without re-filtering every entry.
+        """
+        old = results['moreThanThreeYears']['file_types']
+        mid = results['oneToThreeYears']['file_types']
+        new = results['lessThanOneYear']['file_types']
         summary = {}
-        for file_type in results['moreThanThreeYears']['file_types'].keys():
-            total = (len(results['moreThanThreeYears']['file_types'][file_type]) +
-                    len(results['oneToThreeYears']['file_types'][file_type]) +
-                    len(results['lessThanOneYear']['file_types'][file_type]))
+        for file_type, files in old.items():
+            total = len(files) + len(mid[file_type]) + len(new[file_type])
             if total > 0:
                 summary[file_type] = total
         return summary
@@ -416,30 +465,29 @@ Try any of these commands!"""
             results = await scan_files(source='gdrive', path_or_drive_id=directory if directory else 'drive', drive_service=self.drive_service)
             
             # Create a summary of the results
+            old_sensitive = results['moreThanThreeYears']['sensitive_info']
+            mid_sensitive = results['oneToThreeYears']['sensitive_info']
+            new_sensitive = results['lessThanOneYear']['sensitive_info']
             summary = {
                 'total_files': results['total_files'],
                 'sensitive_files': results['total_sensitive_files'],
                 'storage_used_percentage': self._calculate_storage_percentage(files),
-                'old_files': len([f for f in files if self._is_old_file(f)]),
+                'old_files': sum(1 for f in files if self._is_old_file(f)),
                 'file_types': self._summarize_file_types(results),
                 'age_distribution': {
                     'moreThanThreeYears': results['moreThanThreeYears']['total_documents'],
                     'oneToThreeYears': results['oneToThreeYears']['total_documents'],
                     'lessThanOneYear': results['lessThanOneYear']['total_documents']
                 },
+                # Sum the bucket lengths directly; concatenating the three
+                # lists per category just to len() them copied every element.
                 'sensitive_info': {
-                    'pii': len(results['moreThanThreeYears']['sensitive_info']['pii'] +
-                              results['oneToThreeYears']['sensitive_info']['pii'] +
-                              results['lessThanOneYear']['sensitive_info']['pii']),
-                    'financial': len(results['moreThanThreeYears']['sensitive_info']['financial'] +
-                                   results['oneToThreeYears']['sensitive_info']['financial'] +
-                                   results['lessThanOneYear']['sensitive_info']['financial']),
-                    'legal': len(results['moreThanThreeYears']['sensitive_info']['legal'] +
-                               results['oneToThreeYears']['sensitive_info']['legal'] +
-                               results['lessThanOneYear']['sensitive_info']['legal']),
-                    'confidential': len(results['moreThanThreeYears']['sensitive_info']['confidential'] +
-                                      results['oneToThreeYears']['sensitive_info']['confidential'] +
-                                      results['lessThanOneYear']['sensitive_info']['confidential'])
+                    category: (
+                        len(old_sensitive[category]) +
+                        len(mid_sensitive[category]) +
+                        len(new_sensitive[category])
+                    )
+                    for category in ('pii', 'financial', 'legal', 'confidential')
                 }
             }
 
@@ -824,13 +824,19 @@ class GoogleDriveService:
         categories['summary'] = {
             'total_files': len(files),
             'total_size': sum(int(f.get('size', 0)) for f in files),
+            # Zero-count types are dropped here so downstream renderers and
+            # serialized payloads only carry types that actually occur.
             'by_type': {
-                'documents': len(categories['documents']),
-                'spreadsheets': len(categories['spreadsheets']),
-                'presentations': len(categories['presentations']),
-                'pdfs': len(categories['pdfs']),
-                'images': len(categories['images']),
-                'others': len(categories['others'])
+                type_name: count
+                for type_name, count in (
+                    ('documents', len(categories['documents'])),
+                    ('spreadsheets', len(categories['spreadsheets'])),
+                    ('presentations', len(categories['presentations'])),
+                    ('pdfs', len(categories['pdfs'])),
+                    ('images', len(categories['images'])),
+                    ('others', len(categories['others']))
+                )
+                if count > 0
             },
             'recent_files': len(categories['recent']),
             'large_files': len(categories['large_files']),
@@ -4,6 +4,7 @@ Notification Service for scan results.
 Phase 1: Sends notifications when old files > 0 or sensitive files > 0
 Phase 2: Will extend with thresholds, duplicate prevention, per-user notifications
 """
+import asyncio
 from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 from ..core.config import settings
@@ -119,14 +120,17 @@ class NotificationService:
             
             logger.debug(f"Sending {len(notifications)} notification(s) to channel {self.notification_channel}")
             
-            # Send all notifications
-            for notification in notifications:
-                logger.debug(f"Sending {notification['type']} notification...")
-                await self.slack_service.send_notification_blocks(
+            # Send all notifications concurrently instead of serializing the
+            # Slack round trips; each send already handles its own errors.
+            await asyncio.gather(*(
+                self.slack_service.send_notification_blocks(
                     channel=self.notification_channel,
                     blocks=notification['blocks']
                 )
-                logger.info(f"Successfully sent {notification['type']} notification for {directory_name} to {self.notification_channel}")
+                for notification in notifications
+            ))
+            for notification in notifications:
+                logger.info(f"Sent {notification['type']} notification for {directory_name} to {self.notification_channel}")
                 
         except Exception as e:
             logger.error(f"Error sending scan notifications: {str(e)}", exc_info=True)
@@ -1,153 +1,190 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import orjson
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, List
+from itertools import chain
+from typing import Dict, Iterator, Optional, Any, List, Set, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class CacheEntry:
+    """
+    A single cached scan result.
+
+    Slotted to keep per-entry overhead low: with thousands of cached
+    directories, slotted instances are a fraction of the size of the
+    per-entry dicts they replace, and attribute access is faster than
+    dict subscripting. The payload is held as orjson bytes rather than a
+    live object graph, which is several times smaller for big scan results
+    and keeps cached data immune to accidental mutation by callers.
+    """
+    last_scan: Optional[float] = None  # wall-clock epoch seconds (time.time())
+    data: Optional[bytes] = None  # orjson-serialized scan payload
+    scanned_by_users: Set[int] = field(default_factory=set)
+
+    def payload(self) -> Optional[Dict[str, Any]]:
+        """Deserialize the stored scan payload, or None if empty."""
+        return orjson.loads(self.data) if self.data is not None else None
+
 # Shared cache for directories (keyed by directory_id only)
-# All users share the same directory cache since same directory = same results
-_directory_cache: Dict[str, Dict[str, Any]] = {}
-
-# Per-user cache for drive-wide scans (each user's drive is different)
-_user_drive_cache: Dict[int, Dict[str, Any]] = {}
-
-# Legacy global cache (for backward compatibility when user_id is None)
-_global_cache: Dict[str, Any] = {
-    'drive': {
-        'last_scan': None,
-        'data': None
-    },
-    'directories': {}
+# All users share the same directory cache since same directory = same results.
+# Sharded into fixed sub-dicts so resizes stay small and per-shard locking is
+# possible later; a shard is picked by masking the key hash.
+_DIR_SHARD_COUNT = 16
+_DIR_SHARDS: Tuple[Dict[str, CacheEntry], ...] = tuple({} for _ in range(_DIR_SHARD_COUNT))
+
+def _dir_shard(target_id: str) -> Dict[str, CacheEntry]:
+    """Return the shard holding (or destined to hold) target_id."""
+    return _DIR_SHARDS[hash(target_id) & (_DIR_SHARD_COUNT - 1)]
+
+def _iter_dir_items() -> Iterator[Tuple[str, CacheEntry]]:
+    """Iterate (directory_id, entry) pairs across all shards."""
+    return chain.from_iterable(shard.items() for shard in _DIR_SHARDS)
+
+# Per-user cache for drive-wide scans (each user's drive is different).
+# Bounded: LRU eviction past the cap keeps user churn from growing the
+# store one pinned entry per user forever, the same pattern as the
+# slack_service per-user caches.
+_user_drive_cache: "OrderedDict[int, CacheEntry]" = OrderedDict()
+_USER_DRIVE_CACHE_MAX = 1_000
+
+# Legacy global cache (for backward compatibility when user_id is None).
+# Only the drive-wide scan lives here; legacy directory scans share the
+# sharded directory cache so lookups need a single .get.
+_global_cache: Dict[str, CacheEntry] = {
+    'drive': CacheEntry()
 }
 
 class ScanCacheService:
+    """
+    Cache service for a specific user.
+
+    Architecture:
+    - Directories: Shared cache (keyed by directory_id) - same directory = same results
+    - Drive: Per-user cache (keyed by user_id) - each user's drive is different
+
+    The legacy (user_id=None) and multi-user modes never change for a given
+    instance, so construction dispatches to a mode-specialized subclass whose
+    __init__ picks the (store, key) pair for the drive entry once. Per-call
+    methods route every target through _resolve and carry no mode branches.
+    """
+
+    def __new__(cls, user_id: Optional[int] = None):
+        if cls is ScanCacheService:
+            cls = _LegacyScanCache if user_id is None else _MultiUserScanCache
+        return object.__new__(cls)
+
     def __init__(self, user_id: Optional[int] = None):
         """
         Initialize cache service for a specific user.
-        
-        Architecture:
-        - Directories: Shared cache (keyed by directory_id) - same directory = same results
-        - Drive: Per-user cache (keyed by user_id) - each user's drive is different
-        
+
         Args:
             user_id: Optional user ID for multi-user support. If None, uses global cache (legacy mode).
         """
         self.user_id = user_id
         self.cache_ttl = timedelta(minutes=60)
-        
-        # Initialize per-user drive cache if needed
-        if user_id is not None:
-            if user_id not in _user_drive_cache:
-                _user_drive_cache[user_id] = {
-                    'last_scan': None,
-                    'data': None
-                }
-                logger.debug(f"Initialized per-user drive cache for user_id={user_id}")
-            else:
-                logger.debug(f"Using existing per-user drive cache for user_id={user_id}")
-        else:
-            logger.warning("Using global cache (legacy mode) - user_id is None")
+        # Float mirror of cache_ttl: expiry checks are one float compare
+        # instead of timedelta arithmetic on every cache hit.
+        self._ttl_seconds = self.cache_ttl.total_seconds()
+        # (store, key) for this instance's drive entry, set by the subclass.
+        self._drive_store: Dict[Any, CacheEntry] = {}
+        self._drive_key: Any = None
+
+    def _resolve(self, target_id: str) -> Tuple[Dict[Any, CacheEntry], Any]:
+        """Map a logical target to the (store, key) pair holding its entry."""
+        if target_id == 'drive':
+            return self._drive_store, self._drive_key
+        return _dir_shard(target_id), target_id
+
+    def _get_drive_entry(self) -> Optional[CacheEntry]:
+        return self._drive_store.get(self._drive_key)
+
+    def _set_drive_entry(self, entry: CacheEntry) -> None:
+        self._drive_store[self._drive_key] = entry
+
+    def _invalidate_drive_entry(self) -> None:
+        entry = self._drive_store.get(self._drive_key)
+        if entry is not None:
+            # Reset in place rather than replacing the entry: keeps the
+            # store's slot and the CacheEntry allocation for reuse when the
+            # cache repopulates right after invalidation.
+            entry.last_scan = None
+            entry.data = None
+            logger.debug("Invalidated drive cache (user_id=%s)", self.user_id)
 
     def get_cached_result(self, target_id: str) -> Optional[Dict[str, Any]]:
         """
         Get cached scan result for a target (drive or directory).
         Returns None if no cache exists or if cache is expired.
-        
+
         Architecture:
         - Directories: Shared cache (all users share same directory cache)
         - Drive: Per-user cache (each user's drive is different)
         """
-        try:
-            if target_id == 'drive':
-                # Per-user drive cache
-                if self.user_id is None:
-                    # Legacy mode: use global cache
-                    cache_entry = _global_cache['drive']
-                else:
-                    cache_entry = _user_drive_cache.get(self.user_id)
-                    if not cache_entry:
-                        logger.debug(f"No drive cache found for user_id={self.user_id}")
-                        return None
-            else:
-                # Shared directory cache (all users share same directory cache)
-                logger.debug(f"Checking shared directory cache for {target_id} (user_id={self.user_id}, cache_keys={list(_directory_cache.keys())})")
-                cache_entry = _directory_cache.get(target_id)
-                if not cache_entry:
-                    # Legacy mode: check global cache
-                    if self.user_id is None:
-                        cache_entry = _global_cache['directories'].get(target_id)
-                    if not cache_entry:
-                        logger.info(f"❌ No cache found for directory {target_id} (user_id={self.user_id}, available_keys={list(_directory_cache.keys())})")
-                        return None
-
-            if not cache_entry or not cache_entry.get('last_scan'):
-                logger.debug(f"No cache entry found for {target_id}")
-                return None
-
-            # Check if cache is expired
-            if datetime.utcnow() - cache_entry['last_scan'] > self.cache_ttl:
-                logger.info(f"Cache expired for {target_id}")
-                return None
+        store, key = self._resolve(target_id)
+        cache_entry = store.get(key)
+        if not cache_entry:
+            logger.info("❌ No cache found for %s (user_id=%s)", target_id, self.user_id)
+            return None
 
-            cache_type = "shared directory" if target_id != 'drive' else f"user_{self.user_id} drive"
-            logger.info(f"Using cached result for {target_id} (type={cache_type})")
-            return cache_entry['data']
+        if not cache_entry.last_scan:
+            logger.debug("No cache entry found for %s", target_id)
+            return None
 
-        except Exception as e:
-            logger.error(f"Error getting cached result: {str(e)}", exc_info=True)
+        # Check if cache is expired
+        if time.time() - cache_entry.last_scan > self._ttl_seconds:
+            logger.info("Cache expired for %s", target_id)
             return None
 
-    def update_cache(self, target_id: str, data: Dict[str, Any]) -> None:
+        if logger.isEnabledFor(logging.INFO):
+            cache_type = "shared directory" if target_id != 'drive' else f"user_{self.user_id} drive"
+            logger.info("Using cached result for %s (type=%s)", target_id, cache_type)
+        return cache_entry.payload()
+
+    def update_cache(self, target_id: str, data: Dict[str, Any],
+                     last_scan: Optional[float] = None) -> None:
         """
         Update cache with new scan result.
-        
+
         Architecture:
         - Directories: Shared cache (all users share same directory cache)
         - Drive: Per-user cache (each user's drive is different)
+
+        last_scan overrides the entry timestamp (default: now). Pass the
+        previous entry's value for metadata-only rewrites so they don't
+        extend the scan TTL.
         """
         try:
+            stamp = time.time() if last_scan is None else last_scan
             if target_id == 'drive':
-                # Per-user drive cache
-                if self.user_id is None:
-                    # Legacy mode: use global cache
-                    _global_cache['drive'] = {
-                        'last_scan': datetime.utcnow(),
-                        'data': data
-                    }
-                    logger.debug(f"Updated global drive cache")
-                else:
-                    _user_drive_cache[self.user_id] = {
-                        'last_scan': datetime.utcnow(),
-                        'data': data
-                    }
-                    logger.debug(f"Updated drive cache for user_id={self.user_id}")
+                self._set_drive_entry(CacheEntry(last_scan=stamp, data=orjson.dumps(data, default=str)))
+                logger.debug("Updated drive cache (user_id=%s)", self.user_id)
             else:
-                # Shared directory cache (all users share same directory cache)
-                if target_id not in _directory_cache:
-                    _directory_cache[target_id] = {
-                        'scanned_by_users': []
-                    }
-                
+                # Shared directory cache (all users share same directory cache).
+                # Copy-on-write: build the replacement entry fully, then publish
+                # it with a single dict assignment so concurrent readers never
+                # observe a half-updated entry. Published entries are never
+                # mutated in place.
+                shard = _dir_shard(target_id)
+                prev = shard.get(target_id)
+
                 # Track which users have scanned this directory (for analytics/debugging)
-                if self.user_id and self.user_id not in _directory_cache[target_id]['scanned_by_users']:
-                    _directory_cache[target_id]['scanned_by_users'].append(self.user_id)
-                
-                _directory_cache[target_id].update({
-                    'last_scan': datetime.utcnow(),
-                    'data': data
-                })
-                
-                scanned_by = _directory_cache[target_id].get('scanned_by_users', [])
-                logger.debug(f"Updated shared directory cache for {target_id} (scanned by users: {scanned_by})")
-                
-                # Legacy mode: also update global cache
-                if self.user_id is None:
-                    _global_cache['directories'][target_id] = {
-                        'last_scan': datetime.utcnow(),
-                        'data': data
-                    }
+                scanned_by = set(prev.scanned_by_users) if prev else set()
+                if self.user_id:
+                    scanned_by.add(self.user_id)
+
+                shard[target_id] = CacheEntry(
+                    last_scan=stamp,
+                    data=orjson.dumps(data, default=str),
+                    scanned_by_users=scanned_by
+                )
+
+                logger.debug("Updated shared directory cache for %s (scanned by users: %s)", target_id, scanned_by)
         except Exception as e:
-            logger.error(f"Error updating cache: {str(e)}", exc_info=True)
+            logger.error("Error updating cache: %s", e, exc_info=True)
 
     def invalidate_cache(self, target_id: Optional[str] = None) -> None:
         """
@@ -156,39 +193,20 @@ class ScanCacheService:
         """
         try:
             if target_id is None:
-                # Invalidate all caches
-                if self.user_id is None:
-                    # Legacy mode: invalidate global cache
-                    _global_cache['drive'] = {'last_scan': None, 'data': None}
-                    _global_cache['directories'] = {}
-                    logger.debug("Invalidated all global caches")
-                else:
-                    # Invalidate this user's drive cache
-                    if self.user_id in _user_drive_cache:
-                        _user_drive_cache[self.user_id] = {'last_scan': None, 'data': None}
-                        logger.debug(f"Invalidated drive cache for user_id={self.user_id}")
-                
-                # Invalidate all shared directory caches
-                _directory_cache.clear()
+                # Invalidate this user's drive cache plus all shared directory caches
+                self._invalidate_drive_entry()
+                for shard in _DIR_SHARDS:
+                    shard.clear()
                 logger.debug("Invalidated all shared directory caches")
             elif target_id == 'drive':
                 # Invalidate drive cache for this user
-                if self.user_id is None:
-                    _global_cache['drive'] = {'last_scan': None, 'data': None}
-                    logger.debug("Invalidated global drive cache")
-                else:
-                    if self.user_id in _user_drive_cache:
-                        _user_drive_cache[self.user_id] = {'last_scan': None, 'data': None}
-                        logger.debug(f"Invalidated drive cache for user_id={self.user_id}")
+                self._invalidate_drive_entry()
             else:
                 # Invalidate shared directory cache (affects all users)
-                _directory_cache.pop(target_id, None)
-                # Also invalidate in legacy global cache if exists
-                if self.user_id is None and target_id in _global_cache['directories']:
-                    _global_cache['directories'].pop(target_id, None)
-                logger.debug(f"Invalidated shared directory cache for {target_id}")
+                _dir_shard(target_id).pop(target_id, None)
+                logger.debug("Invalidated shared directory cache for %s", target_id)
         except Exception as e:
-            logger.error(f"Error invalidating cache: {str(e)}", exc_info=True)
+            logger.error("Error invalidating cache: %s", e, exc_info=True)
 
     def get_cache_status(self) -> Dict[str, Any]:
         """
@@ -197,63 +215,100 @@ class ScanCacheService:
         """
         try:
             # Get drive cache status
-            if self.user_id is None:
-                drive_cache = _global_cache['drive']
-            else:
-                drive_cache = _user_drive_cache.get(self.user_id, {'last_scan': None, 'data': None})
-            
+            drive_cache = self._get_drive_entry() or CacheEntry()
+
             status = {
                 'drive': {
-                    'cached': drive_cache.get('last_scan') is not None,
-                    'last_scan': drive_cache['last_scan'].isoformat() if drive_cache.get('last_scan') else None
+                    'cached': drive_cache.last_scan is not None,
+                    'last_scan': datetime.utcfromtimestamp(drive_cache.last_scan).isoformat() if drive_cache.last_scan else None
                 },
                 'directories': {}
             }
 
             # Get all shared directory caches
-            for dir_id, cache_entry in _directory_cache.items():
+            for dir_id, cache_entry in _iter_dir_items():
                 status['directories'][dir_id] = {
-                    'cached': cache_entry.get('last_scan') is not None,
-                    'last_scan': cache_entry['last_scan'].isoformat() if cache_entry.get('last_scan') else None,
-                    'scanned_by_users': cache_entry.get('scanned_by_users', [])
+                    'cached': cache_entry.last_scan is not None,
+                    'last_scan': datetime.utcfromtimestamp(cache_entry.last_scan).isoformat() if cache_entry.last_scan else None,
+                    'scanned_by_users': sorted(cache_entry.scanned_by_users)
                 }
 
             return status
         except Exception as e:
-            logger.error(f"Error getting cache status: {str(e)}", exc_info=True)
+            logger.error("Error getting cache status: %s", e, exc_info=True)
             return {'error': str(e)}
 
     def get_cached_directories(self) -> List[str]:
         """
         Get list of directory IDs that are currently cached (shared directory cache).
+        Returns a snapshot list, safe to hold across cache mutations.
+        """
+        return list(chain.from_iterable(_DIR_SHARDS))
+
+    def iter_cached_directories(self) -> Iterator[str]:
+        """
+        Lazily iterate cached directory IDs without building a list.
+        Prefer this for iterate-once callers; the view is live, so do not
+        mutate the cache while consuming it.
+        """
+        return chain.from_iterable(_DIR_SHARDS)
+
+    def _has_valid(self, target_id: str) -> bool:
         """
-        return list(_directory_cache.keys())
+        Fast path for existence polling: resolves the entry and checks the
+        TTL without the logging and data handling done by get_cached_result.
+        """
+        store, key = self._resolve(target_id)
+        entry = store.get(key)
+        return (
+            entry is not None
+            and entry.last_scan is not None
+            and time.time() - entry.last_scan <= self._ttl_seconds
+        )
 
     def is_cached(self, target_id: str) -> bool:
         """
         Check if a target is currently cached and not expired.
         """
-        return self.get_cached_result(target_id) is not None 
+        return self._has_valid(target_id)
 
-    def get_cache_entry(self, target_id: str) -> Optional[Dict[str, Any]]:
+    def get_cache_entry(self, target_id: str) -> Optional[CacheEntry]:
         """
         Get the full cache entry including metadata for a target (drive or directory).
         Returns None if no cache exists.
         """
-        try:
-            if target_id == 'drive':
-                # Per-user drive cache
-                if self.user_id is None:
-                    return _global_cache['drive']
-                else:
-                    return _user_drive_cache.get(self.user_id)
-            else:
-                # Shared directory cache
-                cache_entry = _directory_cache.get(target_id)
-                if not cache_entry and self.user_id is None:
-                    # Legacy mode: check global cache
-                    cache_entry = _global_cache['directories'].get(target_id)
-                return cache_entry
-        except Exception as e:
-            logger.error(f"Error getting cache entry: {str(e)}", exc_info=True)
-            return None 
\ No newline at end of file
+        store, key = self._resolve(target_id)
+        return store.get(key)
+
+class _LegacyScanCache(ScanCacheService):
+    """Legacy mode (user_id=None): the drive scan lives in the global cache."""
+
+    def __init__(self, user_id: Optional[int] = None):
+        super().__init__(user_id)
+        self._drive_store = _global_cache
+        self._drive_key = 'drive'
+        logger.warning("Using global cache (legacy mode) - user_id is None")
+
+class _MultiUserScanCache(ScanCacheService):
+    """Multi-user mode: each user's drive scan is cached under their user_id."""
+
+    def __init__(self, user_id: Optional[int] = None):
+        super().__init__(user_id)
+        self._drive_store = _user_drive_cache
+        self._drive_key = user_id
+        # Initialize per-user drive cache if needed
+        if user_id not in _user_drive_cache:
+            _user_drive_cache[user_id] = CacheEntry()
+            if len(_user_drive_cache) > _USER_DRIVE_CACHE_MAX:
+                _user_drive_cache.popitem(last=False)
+            logger.debug("Initialized per-user drive cache for user_id=%s", user_id)
+        else:
+            # Touch for LRU so active users stay resident under churn
+            _user_drive_cache.move_to_end(user_id)
+            logger.debug("Using existing per-user drive cache for user_id=%s", user_id)
+
+    def _set_drive_entry(self, entry: CacheEntry) -> None:
+        _user_drive_cache[self.user_id] = entry
+        _user_drive_cache.move_to_end(self.user_id)
+        if len(_user_drive_cache) > _USER_DRIVE_CACHE_MAX:
+            _user_drive_cache.popitem(last=False)
@@ -1,39 +1,45 @@
-from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 from ..core.config import settings
 from .chat_service import ChatService
 from ..db.models import SlackUser, WebUser
 from .google_drive import GoogleDriveService
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from bisect import bisect_left
+from collections import OrderedDict, namedtuple
+from itertools import chain
+import aiohttp
+import asyncio
+import httpx
 import logging
 import json
 import ssl
 import os
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import re
 
 logger = logging.getLogger(__name__)
 
 # Configure SSL certificates for macOS compatibility
-# This ensures Slack API calls work on macOS where Python might not find system certificates
+# This ensures Slack API calls work on macOS where Python might not find system certificates.
+# The CA bundle (thousands of PEM certs) is parsed into one SSLContext at
+# import time and shared by every Slack connection; the old approach
+# monkeypatched ssl._create_default_https_context, re-parsing the bundle
+# for every new HTTPS connection.
+_SSL_CONTEXT: Optional[ssl.SSLContext] = None
 try:
     import certifi
-    # Set SSL certificate file environment variable for urllib (used by Slack SDK)
+    # Set SSL certificate file environment variable for urllib (used by other libraries)
     os.environ['SSL_CERT_FILE'] = certifi.where()
     os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
-    
-    # Also patch ssl._create_default_https_context to use certifi
-    # This ensures urllib uses certifi certificates
-    _original_create_context = ssl._create_default_https_context
-    
-    def _create_https_context_certifi(*args, **kwargs):
-        ctx = _original_create_context(*args, **kwargs)
-        ctx.load_verify_locations(certifi.where())
-        return ctx
-    
-    ssl._create_default_https_context = _create_https_context_certifi
-    
+
+    _SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
     logger.debug(f"Configured SSL certificates using certifi: {certifi.where()}")
 except ImportError:
     logger.warning("certifi not available - SSL certificate verification may fail on macOS")
@@ -43,117 +49,441 @@ except ImportError:
 except Exception as e:
     logger.warning(f"Could not configure SSL certificates: {e}")
 
+# Resolved per-user command context: slack_user_id -> (ChatService, created_at).
+# Before a handler even ran, each inbound command paid a Slack users_info call
+# plus two DB queries (WebUser lookup, credential load) to rebuild the same
+# ChatService. Reusing the resolved context for a minute collapses a command
+# burst to a single dict hit. Bounded like the email cache (LRU + eviction
+# on expired reads): each entry pins a full ChatService, so unbounded growth
+# across distinct users would be a real leak.
+_user_context_cache: "OrderedDict[str, Tuple[ChatService, float]]" = OrderedDict()
+_USER_CONTEXT_TTL = 60.0
+_USER_CONTEXT_MAX = 1_000
+
+# Auth-state cache: slack_user_id -> (is_authenticated, cached_at).
+# Every command checks authentication before dispatch, so a burst from one
+# user would otherwise issue a SlackUser SELECT per event and chew through
+# the connection pool. Entries are dropped whenever tokens change, on
+# expired reads, and by LRU eviction past the size cap.
+_auth_state_cache: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+_AUTH_STATE_MAX = 10_000
+
+# Memoized future for the bot's display name (one auth_test per process).
+_bot_name_future: Optional["asyncio.Future[str]"] = None
+
+# Prebuilt select statements for the per-command lookups. Constructing the
+# statement once at import time lets SQLAlchemy's compiled-SQL cache key off
+# the same object on every call instead of rebuilding the expression tree.
+_SLACK_USER_BY_ID = select(SlackUser).where(SlackUser.slack_user_id == bindparam("sid"))
+_SLACK_USER_TOKEN_BY_ID = select(SlackUser.google_drive_token).where(SlackUser.slack_user_id == bindparam("sid"))
+_WEB_USER_AUTH_BY_EMAIL = select(WebUser.id, WebUser.google_refresh_token).where(WebUser.email == bindparam("email"))
+_AUTH_STATE_TTL = 60.0
+
+# Slack user emails: slack_user_id -> (email, cached_at monotonic).
+# Module-level (the service itself is rebuilt per request) and bounded:
+# LRU eviction keeps a long-running process from growing an entry per
+# unique user forever, and monotonic floats make the TTL check a single
+# compare with no datetime allocation per hit.
+_email_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_EMAIL_CACHE_TTL = 3600.0  # 1 hour
+_EMAIL_CACHE_MAX = 10_000
+
+# In-flight email lookups: concurrent requests for the same user await
+# the first caller's future instead of each issuing their own users_info
+# round trip (and inviting 429s during fan-outs).
+_email_inflight: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+
+# Directory lines in _handle_list output: "- DirectoryName (ID: 1a2b3c4d)".
+# Compiled once; _handle_scan matches it per line when resolving names.
+_DIR_LINE_RE = re.compile(r'- (.+?) \(ID: (.+?)\)')
+
+# Every command /zo understands; unknown input (typos are common) is
+# rejected against this frozenset before any per-command work happens.
+_KNOWN_COMMANDS = frozenset({"help", "connect", "list", "scan"})
+
+# Scan-results header variants (the only static difference between the
+# cache-hit and fresh-scan responses).
+_SCAN_HEADER_LIVE = "Scan Results 📊"
+_SCAN_HEADER_CACHED = "Scan Results 📊 (cached)"
+
+# Static block skeletons for the digest handlers; the dashboard URL
+# comes from settings and never changes within a process, so the action
+# buttons can be fully baked. Callers must treat these as read-only.
+_HOT_ALL_CLEAR_RESPONSE: Dict = {
+    "blocks": [
+        {
+            "type": "header",
+            "text": {"type": "plain_text", "text": "🔥 Hot Items - All Clear!"}
+        },
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": "No urgent items found. Your drive is in good shape! 🎉"}
+        }
+    ]
+}
+_HOT_HEADER_BLOCK: Dict = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "🔥 Hot Items - Immediate Attention Required"}
+}
+_HOT_ACTIONS_BLOCK: Dict = {
+    "type": "actions",
+    "elements": [
+        {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "View Full Analysis"},
+            "url": settings.FRONTEND_URL
+        }
+    ]
+}
+_SUGGEST_HEADER_BLOCK: Dict = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "🤖 AI Recommendations"}
+}
+_SUGGEST_ACTIONS_BLOCK: Dict = {
+    "type": "actions",
+    "elements": [
+        {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "View Detailed Analysis"},
+            "url": settings.FRONTEND_URL
+        }
+    ]
+}
+_AUTOMATE_HEADER_BLOCK: Dict = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "⚙️ Automation Center"}
+}
+_AUTOMATE_ACTIONS_BLOCK: Dict = {
+    "type": "actions",
+    "elements": [
+        {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "Configure Automation"},
+            "url": settings.FRONTEND_URL
+        }
+    ]
+}
+
+# Slack conversation IDs: C/G/D prefix plus uppercase alphanumerics.
+# One compiled match replaces the prefix+length heuristic per send.
+_CHANNEL_ID_RE = re.compile(r'^[CDG][A-Z0-9]{8,}$')
+
+# Channel name -> ID mapping for notification sends, refreshed from
+# conversations_list when the TTL lapses instead of per notification.
+_channel_id_cache: Dict[str, str] = {}
+_channel_cache_expires: float = 0.0
+_CHANNEL_CACHE_TTL = 300.0
+
+# Background scans: bound concurrent Drive traversals and deduplicate
+# concurrent scans of the same directory onto one task.
+_BG_SCAN_SEMAPHORE = asyncio.Semaphore(4)
+_bg_scan_tasks: Dict[str, "asyncio.Task"] = {}
+
+# Strong references to fire-and-forget tasks (mention processing,
+# deferred command dispatch): the event loop only holds weak refs, so
+# without this an in-flight task can be garbage-collected and its
+# response silently dropped.
+_background_tasks: set = set()
+
+
+def _spawn_background(coro) -> "asyncio.Task":
+    """Create a task and keep it referenced until it completes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+# Health-score tables: thresholds are upper bounds per bucket, so
+# bisect_left(thresholds, value) indexes straight into the parallel
+# scores tuple. One C-implemented binary search replaces each if/elif
+# ladder, and the tables double as documentation of the boundaries.
+_SENSITIVE_THRESHOLDS = (0, 5, 10, 20)
+_SENSITIVE_SCORES = (100, 80, 60, 40, 20)
+_OLD_FILES_THRESHOLDS = (0, 10, 25, 50, 100)
+_OLD_FILES_SCORES = (100, 90, 70, 50, 30, 10)
+_STORAGE_THRESHOLDS = (50.0, 70.0, 80.0, 90.0)
+_STORAGE_SCORES = (100, 80, 60, 40, 20)
+
+# Fully static automation-options text, assembled once at import time.
+_AUTOMATION_OPTIONS_TEXT = (
+    "*Available Automations:*\n"
+    "• 🔄 Auto-archive files older than 3 years\n"
+    "• 🔒 Flag sensitive documents for review\n"
+    "• 📊 Weekly storage usage reports\n"
+    "• 🚨 Alert on unusual access patterns\n"
+    "• 🗑️ Suggest duplicate file removal\n\n"
+    "*Coming Soon:*\n"
+    "• 📅 Scheduled cleanup workflows\n"
+    "• 🤖 AI-powered content categorization\n"
+    "• 📧 Email digest notifications"
+)
+
+# The stats fields every digest helper consumes, extracted in one pass.
+# Namedtuple attribute access is C-level and cheaper than repeated
+# defaulted dict.get calls scattered through each helper.
+_Stats = namedtuple('_Stats', 'sensitive_files old_files total_files storage_used_percentage')
+
+def _extract_stats(stats: Dict[str, Any]) -> _Stats:
+    """Pull the common stat fields out of a stats dict once."""
+    g = stats.get
+    return _Stats(
+        g('sensitive_files', 0),
+        g('old_files', 0),
+        g('total_files', 0),
+        g('storage_used_percentage', 0),
+    )
+
+# Urgent-item tiers: (threshold, template) pairs ordered highest first;
+# the first threshold the value exceeds wins. Data edits here replace
+# branch-ladder edits when severity boundaries change.
+_SENSITIVE_TIERS = (
+    (10, "🚨 CRITICAL: {n} sensitive files need immediate review"),
+    (5, "🔒 HIGH: {n} sensitive files need review"),
+    (0, "🔒 {n} sensitive files need review"),
+)
+_STORAGE_TIERS = (
+    (90, "💾 CRITICAL: Storage at {n}% - immediate cleanup needed"),
+    (80, "💾 HIGH: Storage at {n}% - cleanup recommended"),
+    (70, "💾 Storage usage is at {n}%"),
+)
+_OLD_FILES_TIERS = (
+    (50, "📅 {n} files are over 3 years old - consider archiving"),
+    (20, "📅 {n} files are over 3 years old"),
+)
+
+def _first_tier(value, tiers) -> Optional[str]:
+    """Format the template of the first tier whose threshold value exceeds."""
+    for threshold, template in tiers:
+        if value > threshold:
+            return template.format(n=value)
+    return None
+
+# Static header block for the security summary, shared across calls
+# (read-only by convention, like the templates on SlackMessageTemplates).
+_RISKS_HEADER_BLOCK = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "Security Summary 🔒"}
+}
+
+# Constant portion of the security-summary button; per call only the url
+# key is added via a shallow merge, so the nested text dict is shared.
+_SECURITY_BUTTON = {
+    "type": "button",
+    "text": {"type": "plain_text", "text": "View Security Details"}
+}
+
+# One Slack client per process. Each client owns its own connection pool,
+# so building one in every per-request SlackService defeated TCP/TLS
+# connection reuse to slack.com and paid a fresh handshake per API call.
+# The async client keeps Slack I/O off the event loop's back: a blocked
+# network call no longer stalls every other in-flight webhook.
+_slack_client = AsyncWebClient(token=settings.SLACK_BOT_TOKEN, ssl=_SSL_CONTEXT)
+
+# Without an attached session the SDK opens a fresh aiohttp.ClientSession
+# (and with it a new TCP+TLS handshake) for every single API call. One
+# lazily created shared session keeps connections alive across calls.
+# Created from coroutine context so it binds to the serving event loop.
+def _ensure_slack_session() -> None:
+    session = _slack_client.session
+    if session is None or session.closed:
+        _slack_client.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+
+# Caps concurrent chat_postMessage calls per process so fan-out sends
+# overlap their round trips without tripping Slack's rate limits.
+_SEND_SEMAPHORE = asyncio.Semaphore(8)
+
+# Shared client for posting deferred command results back to Slack's
+# response_url. Pooled connections avoid a TLS handshake per delivery.
+_response_client: Optional[httpx.AsyncClient] = None
+
+def _get_response_client() -> httpx.AsyncClient:
+    global _response_client
+    if _response_client is None:
+        _response_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+    return _response_client
+
 class SlackMessageTemplates:
+    # Static pieces of the status message; only the score, urgent-items
+    # text and dashboard URL vary per call.
+    _STATUS_HEADER_BLOCK: Dict = {
+        "type": "header",
+        "text": {"type": "plain_text", "text": "Drive Health Status 🏥"}
+    }
+    _STATUS_BUTTON: Dict = {
+        "type": "button",
+        "text": {"type": "plain_text", "text": "View Details"}
+    }
+
     @staticmethod
     def status_message(health_score: int, urgent_items: List[str], dashboard_url: str) -> Dict:
         return {
             "blocks": [
-                {
-                    "type": "header",
-                    "text": {"type": "plain_text", "text": "Drive Health Status 🏥"}
-                },
+                SlackMessageTemplates._STATUS_HEADER_BLOCK,
                 {
                     "type": "section",
                     "text": {"type": "mrkdwn", "text": f"*Health Score:* {health_score}/100"}
                 },
                 {
                     "type": "section",
-                    "text": {"type": "mrkdwn", "text": "*Urgent Items:*\n" + 
-                            "\n".join(f"• {item}" for item in urgent_items)}
+                    "text": {"type": "mrkdwn", "text":
+                            "\n".join(chain(("*Urgent Items:*",), (f"• {item}" for item in urgent_items)))}
                 },
                 {
                     "type": "actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {"type": "plain_text", "text": "View Details"},
-                            "url": dashboard_url
-                        }
-                    ]
+                    "elements": [{**SlackMessageTemplates._STATUS_BUTTON, "url": dashboard_url}]
                 }
             ]
         }
 
 
+    # Static payloads are assembled once at import time; the accessors hand
+    # back the shared instance instead of reallocating an identical block
+    # tree on every command. Callers must treat these as read-only.
+    _HELP_RESPONSE: Dict = {
+        "blocks": [
+            {
+                "type": "header",
+                "text": {"type": "plain_text", "text": "Zo - Your Drive Assistant 🤖"}
+            },
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text":
+                    "*Available Commands:*\n\n"
+                    "• `/zo help` - Show this help message\n"
+                    "• `/zo connect` - Connect your Google Drive\n"
+                    "• `/zo list` - List your directories\n"
+                    "• `/zo scan [directory]` - Scan a directory and show files by age"
+                }
+            }
+        ]
+    }
+
     @staticmethod
     def help_message() -> Dict:
-        return {
-            "blocks": [
-                {
-                    "type": "header",
-                    "text": {"type": "plain_text", "text": "Zo - Your Drive Assistant 🤖"}
-                },
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": 
-                        "*Available Commands:*\n\n" +
-                        "• `/zo help` - Show this help message\n" +
-                        "• `/zo connect` - Connect your Google Drive\n" +
-                        "• `/zo list` - List your directories\n" +
-                        "• `/zo scan [directory]` - Scan a directory and show files by age"
-                    }
-                }
-            ]
-        }
+        return SlackMessageTemplates._HELP_RESPONSE
 
 class SlackService:
     def __init__(self, chat_service: ChatService, db: Session):
-        # Initialize Slack client
+        # Shared process-wide Slack client (see _slack_client above)
         # SSL certificates are configured at module level via environment variables
-        self.client = WebClient(token=settings.SLACK_BOT_TOKEN)
+        self.client = _slack_client
         
         self.chat_service = chat_service
         self.db = db
         self.templates = SlackMessageTemplates()
         self.dashboard_base_url = settings.FRONTEND_URL
-        self._bot_info_cache = None
+        # Per-directory dashboard link template; .format avoids rebuilding
+        # the base-URL part of the f-string on every scan response.
+        self._dashboard_dir_url_fmt = settings.FRONTEND_URL + "?directory={}"
         # Cache for Slack user emails: {slack_user_id: (email, cached_at)}
-        self._email_cache: Dict[str, tuple[str, datetime]] = {}
-        self._email_cache_ttl = timedelta(hours=1)  # Cache email for 1 hour
+        # Dispatch tables for /zo commands, built once per service instead
+        # of reallocating the dicts and bound methods on every invocation.
+        # Handlers in the first table require authentication.
+        self._authenticated_handlers = {
+            "list": self._handle_list,
+            "scan": self._handle_scan
+        }
+        self._unauthenticated_handlers = {
+            "help": self._handle_help,
+            "connect": self._handle_connect
+        }
     
-    def get_bot_name(self) -> str:
+    async def get_bot_name(self) -> str:
         """
         Get the bot's display name for notifications/invites.
-        Caches the result to avoid repeated API calls.
+        Memoizes the auth_test as a shared future so concurrent first
+        callers all await one API call instead of each firing their own.
         """
-        if self._bot_info_cache is None:
+        global _bot_name_future
+        if _bot_name_future is None:
+            # Creating and publishing the future before the first await is
+            # atomic on the event loop, so only one auth_test ever runs.
+            _bot_name_future = asyncio.get_running_loop().create_future()
             try:
-                result = self.client.auth_test()
-                self._bot_info_cache = result.get("user", "Zo")
-                logger.info(f"Bot name retrieved: {self._bot_info_cache}")
+                _ensure_slack_session()
+                result = await self.client.auth_test()
+                name = result.get("user", "Zo")
+                logger.info("Bot name retrieved: %s", name)
+                _bot_name_future.set_result(name)
             except Exception as e:
                 logger.warning(f"Could not get bot name from Slack API: {e}")
-                self._bot_info_cache = "Zo"  # Default fallback
-        return self._bot_info_cache
+                _bot_name_future.set_result("Zo")  # Default fallback
+                _bot_name_future = None  # retry on the next call
+                return "Zo"
+        return await _bot_name_future
         
     async def is_user_authenticated(self, user_id: str) -> bool:
-        """Check if a user is authenticated with Google Drive"""
-        user = self.db.query(SlackUser).filter(SlackUser.slack_user_id == user_id).first()
-        return user is not None and user.google_drive_token is not None
+        """Check if a user is authenticated with Google Drive (cached briefly)"""
+        cached = _auth_state_cache.get(user_id)
+        if cached is not None:
+            if time.time() - cached[1] < _AUTH_STATE_TTL:
+                _auth_state_cache.move_to_end(user_id)
+                return cached[0]
+            del _auth_state_cache[user_id]
+        authenticated = await asyncio.to_thread(self._query_auth_state, user_id)
+        _auth_state_cache[user_id] = (authenticated, time.time())
+        if len(_auth_state_cache) > _AUTH_STATE_MAX:
+            _auth_state_cache.popitem(last=False)
+        return authenticated
         
+    def _query_slack_user(self, user_id: str) -> Optional[SlackUser]:
+        """Synchronous SlackUser lookup, run on the thread pool by callers."""
+        return self.db.execute(_SLACK_USER_BY_ID, {"sid": user_id}).scalars().first()
+
+    def _query_auth_state(self, user_id: str) -> bool:
+        """Synchronous auth check that loads only the token column instead
+        of the full SlackUser row; run on the thread pool by callers."""
+        row = self.db.execute(_SLACK_USER_TOKEN_BY_ID, {"sid": user_id}).first()
+        return row is not None and row[0] is not None
+
     async def store_google_tokens(self, user_id: str, access_token: str, refresh_token: str, expires_in: int) -> None:
         """Store Google Drive tokens for a Slack user"""
         try:
-            user = self.db.query(SlackUser).filter(SlackUser.slack_user_id == user_id).first()
-            if not user:
-                user = SlackUser(slack_user_id=user_id)
-                self.db.add(user)
-            
-            user.google_drive_token = access_token
-            user.google_drive_refresh_token = refresh_token
-            user.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
-            
-            self.db.commit()
-            logger.info(f"Stored Google Drive tokens for user {user_id}")
+            # Single-statement upsert: the old select-then-insert-or-update
+            # pattern cost two round trips and held the row lock longer.
+            # Both our backends (SQLite locally, PostgreSQL in production)
+            # speak ON CONFLICT; SQLAlchemy just exposes it per dialect.
+            dialect = self.db.get_bind().dialect.name
+            insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            stmt = insert(SlackUser).values(
+                slack_user_id=user_id,
+                google_drive_token=access_token,
+                google_drive_refresh_token=refresh_token,
+                token_expires_at=datetime.utcnow() + timedelta(seconds=expires_in)
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['slack_user_id'],
+                set_={
+                    'google_drive_token': stmt.excluded.google_drive_token,
+                    'google_drive_refresh_token': stmt.excluded.google_drive_refresh_token,
+                    'token_expires_at': stmt.excluded.token_expires_at
+                }
+            )
+            # Off the event loop: the execute+commit round trip would
+            # otherwise block every other in-flight webhook handler.
+            await asyncio.to_thread(self._execute_and_commit, stmt)
+            _user_context_cache.pop(user_id, None)
+            _auth_state_cache.pop(user_id, None)
+            logger.info("Stored Google Drive tokens for user %s", user_id)
         except Exception as e:
             logger.error(f"Error storing Google Drive tokens: {str(e)}")
             self.db.rollback()
             raise
             
+    def _execute_and_commit(self, stmt) -> None:
+        """Synchronous execute+commit, run on the thread pool by callers."""
+        self.db.execute(stmt)
+        self.db.commit()
+
     async def get_google_tokens(self, user_id: str) -> dict:
         """Retrieve Google Drive tokens for a Slack user"""
         try:
-            user = self.db.query(SlackUser).filter(SlackUser.slack_user_id == user_id).first()
+            user = await asyncio.to_thread(self._query_slack_user, user_id)
             if not user or not user.google_drive_token:
                 return None
                 
@@ -177,16 +507,24 @@ class SlackService:
             logger.error(f"Error retrieving Google Drive tokens: {str(e)}")
             return None
             
+    def _clear_tokens_sync(self, user_id: str) -> bool:
+        """Synchronous token clear, run on the thread pool by callers."""
+        user = self.db.execute(_SLACK_USER_BY_ID, {"sid": user_id}).scalars().first()
+        if not user:
+            return False
+        user.google_drive_token = None
+        user.google_drive_refresh_token = None
+        user.token_expires_at = None
+        self.db.commit()
+        return True
+
     async def clear_google_tokens(self, user_id: str) -> None:
         """Clear Google Drive tokens for a Slack user"""
         try:
-            user = self.db.query(SlackUser).filter(SlackUser.slack_user_id == user_id).first()
-            if user:
-                user.google_drive_token = None
-                user.google_drive_refresh_token = None
-                user.token_expires_at = None
-                self.db.commit()
-                logger.info(f"Cleared Google Drive tokens for user {user_id}")
+            if await asyncio.to_thread(self._clear_tokens_sync, user_id):
+                _user_context_cache.pop(user_id, None)
+                _auth_state_cache.pop(user_id, None)
+                logger.info("Cleared Google Drive tokens for user %s", user_id)
         except Exception as e:
             logger.error(f"Error clearing Google Drive tokens: {str(e)}")
             self.db.rollback()
@@ -195,39 +533,77 @@ class SlackService:
     async def get_slack_user_email(self, slack_user_id: str) -> Optional[str]:
         """Get Slack user's email from Slack API (with caching)"""
         # Check cache first
-        if slack_user_id in self._email_cache:
-            email, cached_at = self._email_cache[slack_user_id]
-            if datetime.utcnow() - cached_at < self._email_cache_ttl:
-                logger.debug(f"Using cached email for Slack user {slack_user_id}: {email}")
+        cached = _email_cache.get(slack_user_id)
+        if cached is not None:
+            email, cached_at = cached
+            if time.monotonic() - cached_at < _EMAIL_CACHE_TTL:
+                _email_cache.move_to_end(slack_user_id)
+                logger.debug("Using cached email for Slack user %s: %s", slack_user_id, email)
                 return email
-            else:
-                # Cache expired, remove it
-                del self._email_cache[slack_user_id]
-        
-        # Cache miss or expired - fetch from Slack API
+            # Cache expired, remove it
+            del _email_cache[slack_user_id]
+
+        # Coalesce with any in-flight lookup for the same user
+        inflight = _email_inflight.get(slack_user_id)
+        if inflight is not None:
+            return await inflight
+
+        future: "asyncio.Future[Optional[str]]" = asyncio.get_running_loop().create_future()
+        _email_inflight[slack_user_id] = future
         try:
-            response = self.client.users_info(user=slack_user_id)
+            email = await self._fetch_slack_user_email(slack_user_id)
+        finally:
+            _email_inflight.pop(slack_user_id, None)
+            if not future.done():
+                # _fetch_slack_user_email swallows its own errors; this
+                # guards waiters against anything unexpected (cancellation)
+                future.set_result(None)
+        return email
+
+    async def _fetch_slack_user_email(self, slack_user_id: str) -> Optional[str]:
+        """Uncached users_info lookup; resolves the in-flight future."""
+        future = _email_inflight.get(slack_user_id)
+        try:
+            _ensure_slack_session()
+            response = await self.client.users_info(user=slack_user_id)
             if response["ok"]:
                 user_info = response["user"]
                 email = user_info.get("profile", {}).get("email")
                 if email:
-                    # Cache the email
-                    self._email_cache[slack_user_id] = (email, datetime.utcnow())
-                    logger.info(f"Retrieved and cached Slack user email for {slack_user_id}: {email}")
-                    return email
+                    # Cache the email, evicting the least recently used
+                    # entry once the cache is full
+                    _email_cache[slack_user_id] = (email, time.monotonic())
+                    if len(_email_cache) > _EMAIL_CACHE_MAX:
+                        _email_cache.popitem(last=False)
+                    logger.info("Retrieved and cached Slack user email for %s: %s", slack_user_id, email)
+                    result = email
                 else:
                     logger.warning(f"No email found for Slack user {slack_user_id}")
-                    return None
+                    result = None
             else:
                 logger.error(f"Slack API error getting user info: {response.get('error')}")
-                return None
+                result = None
         except SlackApiError as e:
             logger.error(f"Slack API error getting user email: {e}")
-            return None
+            result = None
         except Exception as e:
             logger.error(f"Error getting Slack user email: {str(e)}", exc_info=True)
-            return None
+            result = None
+        if future is not None and not future.done():
+            future.set_result(result)
+        return result
     
+    def _load_web_user_auth(self, email: str) -> Optional[Tuple[int, Optional[str]]]:
+        """
+        Fetch (web_user_id, google_refresh_token) for an email and end the
+        transaction so the DB connection goes back to the pool immediately.
+        Run on the thread pool by callers.
+        """
+        row = self.db.execute(_WEB_USER_AUTH_BY_EMAIL, {"email": email}).first()
+        result = (row.id, row.google_refresh_token) if row else None
+        self.db.commit()
+        return result
+
     async def get_user_drive_service(self, slack_user_id: str) -> Optional[GoogleDriveService]:
         """
         Get authenticated GoogleDriveService for a Slack user.
@@ -240,24 +616,28 @@ class SlackService:
                 logger.warning(f"Could not get email for Slack user {slack_user_id}")
                 return None
             
-            # Look up WebUser by email
-            web_user = self.db.query(WebUser).filter(WebUser.email == slack_email).first()
-            if not web_user:
+            # Look up WebUser by email in a short transaction; the id and
+            # refresh token come back as plain values and the connection is
+            # released before the Google credential refresh network call,
+            # instead of pinning a pooled connection across the round trip.
+            looked_up = await asyncio.to_thread(self._load_web_user_auth, slack_email)
+            if looked_up is None:
                 logger.warning(f"No WebUser found for email {slack_email} (Slack user {slack_user_id})")
                 return None
-            
-            if not web_user.google_refresh_token:
-                logger.warning(f"WebUser {web_user.email} has no Google Drive credentials")
+            web_user_id, google_refresh_token = looked_up
+
+            if not google_refresh_token:
+                logger.warning(f"WebUser {slack_email} has no Google Drive credentials")
                 return None
             
             # Create GoogleDriveService with user's credentials
-            drive_service = GoogleDriveService(user_id=web_user.id)
-            credentials = drive_service.load_credentials_from_db(self.db, web_user.google_refresh_token)
+            drive_service = GoogleDriveService(user_id=web_user_id)
+            credentials = drive_service.load_credentials_from_db(self.db, google_refresh_token)
             if not credentials:
-                logger.error(f"Failed to load credentials for WebUser {web_user.email}")
+                logger.error(f"Failed to load credentials for WebUser {slack_email}")
                 return None
             
-            logger.info(f"Created authenticated drive_service for Slack user {slack_user_id} (email: {slack_email}, web_user_id: {web_user.id})")
+            logger.info("Created authenticated drive_service for Slack user %s (email: %s, web_user_id: %s)", slack_user_id, slack_email, web_user_id)
             return drive_service
             
         except Exception as e:
@@ -268,18 +648,44 @@ class SlackService:
         """
         Get user-specific ChatService for a Slack user.
         Returns None if user is not linked or not authenticated.
+        Successful resolutions are cached briefly so back-to-back commands
+        from the same user don't repeat the email/user/credential round trips.
         """
+        cached = _user_context_cache.get(slack_user_id)
+        if cached is not None:
+            if time.time() - cached[1] < _USER_CONTEXT_TTL:
+                _user_context_cache.move_to_end(slack_user_id)
+                return cached[0]
+            del _user_context_cache[slack_user_id]
+
         drive_service = await self.get_user_drive_service(slack_user_id)
         if not drive_service:
             return None
-        return ChatService(drive_service=drive_service)
+        chat_service = ChatService(drive_service=drive_service)
+        _user_context_cache[slack_user_id] = (chat_service, time.time())
+        if len(_user_context_cache) > _USER_CONTEXT_MAX:
+            _user_context_cache.popitem(last=False)
+        return chat_service
     
+    # Built once: the dashboard URL comes from settings and never changes
+    # within a process, so the auth error payload is a shared constant.
+    _AUTH_ERROR_RESPONSE: Dict = {
+        "response_type": "ephemeral",
+        "text": f"❌ Not authenticated. Please link your Slack account to your Google Drive account.\n\nVisit: {settings.FRONTEND_URL} to authenticate."
+    }
+
+    _CONNECT_OK_RESPONSE: Dict = {
+        "blocks": [
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": "✅ Connected to Google Drive! (using shared session for testing)"}
+            }
+        ]
+    }
+
     def _get_auth_error_message(self) -> Dict:
         """Get standard authentication error message"""
-        return {
-            "response_type": "ephemeral",
-            "text": f"❌ Not authenticated. Please link your Slack account to your Google Drive account.\n\nVisit: {self.dashboard_base_url} to authenticate."
-        }
+        return self._AUTH_ERROR_RESPONSE
     
     async def _with_user_chat_service(
         self,
@@ -307,76 +713,87 @@ class SlackService:
         return await handler(args, user_id, channel_id, user_chat_service)
         
     async def handle_mention(self, event_data: dict) -> None:
-        """Handle app mention events"""
+        """
+        Handle app mention events.
+
+        Ack-first: Slack retries events that aren't acknowledged within 3
+        seconds, so the actual command processing runs as a background task
+        and this method returns as soon as the event is parsed.
+        """
+        # Extract channel and text from the event
+        channel_id = event_data.get("channel")
+        text = event_data.get("text", "")
+
+        # Remove the bot mention from the text
+        # Format is typically <@BOT_ID> command
+        command = " ".join(text.split()[1:]) if text else ""
+
+        logger.debug("Processing command from mention: %s", command)
+
+        if not command:
+            await self.send_message(channel_id, "How can I help you? Try typing 'help' to see available commands.")
+            return
+
+        _spawn_background(self._process_mention(command, channel_id))
+
+    async def _process_mention(self, command: str, channel_id: str) -> None:
+        """Process a mention command in the background and post the result."""
         try:
-            # Extract channel and text from the event
-            channel_id = event_data.get("channel")
-            text = event_data.get("text", "")
-            user = event_data.get("user")
-            
-            # Remove the bot mention from the text
-            # Format is typically <@BOT_ID> command
-            command = " ".join(text.split()[1:]) if text else ""
-            
-            logger.debug(f"Processing command from mention: {command}")
-            
-            if not command:
-                await self.send_message(channel_id, "How can I help you? Try typing 'help' to see available commands.")
-                return
-                
             # Process the command through our chat service
             response = await self.chat_service.process_message(command)
-            
+
             # Send the response back to Slack
             await self.send_message(channel_id, response.get("content", "Sorry, I couldn't process that command."))
-            
         except Exception as e:
             logger.error(f"Error handling mention: {str(e)}", exc_info=True)
-            await self.send_message(channel_id, f"Sorry, I encountered an error processing your request: {str(e)}")
+            # Shielded so the apology still goes out if the surrounding task
+            # is cancelled by a Slack retry.
+            await asyncio.shield(
+                self.send_message(channel_id, f"Sorry, I encountered an error processing your request: {str(e)}")
+            )
     
     async def handle_slash_command(self, command_data: dict) -> dict:
         """Handle slash commands"""
         try:
-            logger.debug(f"Received command data: {command_data}")
+            logger.debug("Received command data: %s", command_data)
             
             command_text = command_data.get("text", "").strip()
-            channel_id = command_data.get("channel_id")
-            user_id = command_data.get("user_id")
-            
             if not command_text:
                 return self.templates.help_message()
 
-            # Parse command and arguments
-            parts = command_text.split()
-            command = parts[0].lower()
-            args = parts[1:] if len(parts) > 1 else []
+            # Parse command and arguments in one pass; unpacking avoids
+            # the extra length check and slice of the two-step version.
+            command, *args = command_text.split()
+            command = command.lower()
 
-            # Command handlers for /zo commands
-            # Handlers that require authentication
-            authenticated_handlers = {
-                "list": self._handle_list,
-                "scan": self._handle_scan
-            }
-            
-            # Handlers that don't require authentication
-            unauthenticated_handlers = {
-                "help": self._handle_help,
-                "connect": self._handle_connect
-            }
-            
-            # Check if command requires authentication
-            if command in authenticated_handlers:
-                handler = authenticated_handlers[command]
-                return await self._with_user_chat_service(user_id, handler, args, channel_id)
-            elif command in unauthenticated_handlers:
-                handler = unauthenticated_handlers[command]
-                return await handler(args, user_id, channel_id)
-            else:
+            # Short-circuit unknown commands before any further field
+            # extraction or dispatch work.
+            if command not in _KNOWN_COMMANDS:
                 return {
                     "response_type": "ephemeral",
                     "text": f"Unknown command: {command}. Try `/zo help` for available commands."
                 }
 
+            channel_id = command_data.get("channel_id")
+            user_id = command_data.get("user_id")
+            response_url = command_data.get("response_url")
+
+            # Check if command requires authentication (dispatch tables
+            # are built once in __init__)
+            handler = self._authenticated_handlers.get(command)
+            if handler is not None:
+                if response_url:
+                    # Ack-first: list/scan can blow Slack's 3-second command
+                    # timeout, which triggers duplicate retries. Acknowledge
+                    # now, finish the work in the background and deliver the
+                    # real payload to response_url.
+                    _spawn_background(
+                        self._dispatch_deferred(command, args, user_id, channel_id, response_url)
+                    )
+                    return {"response_type": "ephemeral", "text": "⏳ Working on it..."}
+                return await self._with_user_chat_service(user_id, handler, args, channel_id)
+            return await self._unauthenticated_handlers[command](args, user_id, channel_id)
+
         except Exception as e:
             logger.error(f"Error handling slash command: {str(e)}", exc_info=True)
             return {
@@ -384,6 +801,39 @@ class SlackService:
                 "text": f"Sorry, I encountered an error processing your command: {str(e)}"
             }
 
+    async def _dispatch_deferred(
+        self,
+        command: str,
+        args: List[str],
+        user_id: str,
+        channel_id: str,
+        response_url: str
+    ) -> None:
+        """Run a slow command handler off the webhook path and POST the result to response_url."""
+        from ..db.database import SessionLocal
+
+        # The request-scoped session is torn down by FastAPI as soon as
+        # the ack returns, so this task gets its own session on a worker
+        # service (same pattern as the activity flusher) instead of racing
+        # teardown on the borrowed one.
+        session = SessionLocal()
+        try:
+            worker = SlackService(chat_service=self.chat_service, db=session)
+            handler = worker._authenticated_handlers[command]
+            payload = await worker._with_user_chat_service(user_id, handler, args, channel_id)
+        except Exception as e:
+            logger.error(f"Error in deferred command handler: {str(e)}", exc_info=True)
+            payload = {
+                "response_type": "ephemeral",
+                "text": f"Sorry, I encountered an error processing your command: {str(e)}"
+            }
+        finally:
+            session.close()
+        try:
+            await _get_response_client().post(response_url, json=payload)
+        except Exception as e:
+            logger.error(f"Failed to deliver deferred response to {response_url}: {str(e)}")
+
     async def _handle_help(self, args: List[str], user_id: str, channel_id: str) -> Dict:
         return self.templates.help_message()
 
@@ -395,23 +845,16 @@ class SlackService:
             is_authenticated = await self.chat_service.drive_service.is_authenticated()
             
             if is_authenticated:
-                return {
-                    "blocks": [
-                        {
-                            "type": "section",
-                            "text": {"type": "mrkdwn", "text": "✅ Connected to Google Drive! (using shared session for testing)"}
-                        }
-                    ]
-                }
+                return self._CONNECT_OK_RESPONSE
             
             return {
                 "blocks": [
                     {
                         "type": "section",
                         "text": {"type": "mrkdwn", "text": 
-                            "❌ *Not Connected*\n\n" +
-                            "Please authenticate via the web dashboard first:\n" +
-                            f"{self.dashboard_base_url}"
+                            "❌ *Not Connected*\n\n"
+                            "Please authenticate via the web dashboard first:\n"
+                            + self.dashboard_base_url
                         }
                     }
                 ]
@@ -443,6 +886,44 @@ class SlackService:
             logger.error(f"Error in list command: {str(e)}", exc_info=True)
             return {"response_type": "ephemeral", "text": f"Error listing directories: {str(e)}"}
 
+    def _build_scan_response(self, display_name: str, directory: str, stats: Dict, cached: bool) -> Dict:
+        """Compose the scan-results block tree shared by the cache-hit and
+        fresh-scan paths; only the header suffix and the numbers differ."""
+        by_age = stats.get('by_age_group', {}) if stats else {}
+        more_than_3y = by_age.get('moreThanThreeYears', 0)
+        one_to_3y = by_age.get('oneToThreeYears', 0)
+        less_than_1y = by_age.get('lessThanOneYear', 0)
+        total = more_than_3y + one_to_3y + less_than_1y
+        return {
+            "blocks": [
+                {
+                    "type": "header",
+                    "text": {"type": "plain_text", "text": _SCAN_HEADER_CACHED if cached else _SCAN_HEADER_LIVE}
+                },
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": 
+                        f"*Directory:* {display_name}\n"
+                        f"*Total Files:* {total}\n\n"
+                        "*Files by Age:*\n"
+                        f"• More than 3 years: {more_than_3y}\n"
+                        f"• 1-3 years: {one_to_3y}\n"
+                        f"• Less than 1 year: {less_than_1y}"
+                    }
+                },
+                {
+                    "type": "actions",
+                    "elements": [
+                        {
+                            "type": "button",
+                            "text": {"type": "plain_text", "text": "View Full Dashboard"},
+                            "url": self._dashboard_dir_url_fmt.format(directory)
+                        }
+                    ]
+                }
+            ]
+        }
+
     async def _handle_scan(self, args: List[str], user_id: str, channel_id: str, user_chat_service: ChatService) -> Dict:
         """Scan a directory and show files by age"""
         if not args:
@@ -460,97 +941,87 @@ class SlackService:
             
             # If it looks like a name (not a long ID), try to find the ID
             if len(directory_input) < 20:  # IDs are typically longer
-                try:
-                    # Get list of directories using user-specific chat_service
-                    response = await user_chat_service._handle_list("")
-                    content = response.get("content", "")
-                    
-                    # Parse the directory list to find matching name
-                    # Format is: "- DirectoryName (ID: 1a2b3c4d)"
-                    for line in content.split('\n'):
-                        match = re.search(rf'- (.+?) \(ID: (.+?)\)', line)
-                        if match:
-                            name, dir_id = match.groups()
-                            if name.lower().strip() == directory_input.lower().strip():
-                                directory = dir_id
-                                logger.info(f"Resolved directory name '{directory_input}' to ID '{directory}'")
-                                break
-                except Exception as e:
-                    logger.warning(f"Could not resolve directory name: {e}")
-                    # Continue with original input
+                target = directory_input.lower().strip()
+                # The scan cache is keyed by whatever the user typed when a
+                # short ID was scanned directly; an in-memory hit on the raw
+                # input makes name resolution (and its list fetch) moot.
+                cached_result = user_chat_service.scan_cache.get_cached_result(directory_input)
+                if cached_result:
+                    return self._build_scan_response(
+                        directory_input, directory_input, cached_result.get('stats'), cached=True
+                    )
+                # A previous list call may already know this name; resolving
+                # from the cache skips the full directory-list fetch.
+                cached_id = user_chat_service.lookup_directory_id(target)
+                if cached_id is not None:
+                    directory = cached_id
+                else:
+                    try:
+                        # Get list of directories using user-specific chat_service
+                        # (this also repopulates the name→id cache)
+                        response = await user_chat_service._handle_list("")
+                        content = response.get("content", "")
+                        
+                        # Parse the directory list to find matching name
+                        # (pattern precompiled at module scope; the needle is
+                        # normalized once, not per line)
+                        for line in content.splitlines():
+                            match = _DIR_LINE_RE.search(line)
+                            if match:
+                                name, dir_id = match.groups()
+                                if name.lower().strip() == target:
+                                    directory = dir_id
+                                    logger.info("Resolved directory name '%s' to ID '%s'", directory_input, directory)
+                                    break
+                    except Exception as e:
+                        logger.warning(f"Could not resolve directory name: {e}")
+                        # Continue with original input
             
             # Check cache first for quick response (using user-specific cache)
             cached_result = user_chat_service.scan_cache.get_cached_result(directory)
             
             if cached_result:
-                # We have cached data, return it immediately
-                stats = cached_result.get('stats', {})
-                by_age = stats.get('by_age_group', {})
-                
-                more_than_3y = by_age.get('moreThanThreeYears', 0)
-                one_to_3y = by_age.get('oneToThreeYears', 0)
-                less_than_1y = by_age.get('lessThanOneYear', 0)
-                total = more_than_3y + one_to_3y + less_than_1y
-                
+                # We have cached data, return it immediately.
                 # Show the name if it was resolved, otherwise show the ID
                 display_name = directory_input if directory != directory_input else directory
-                
-                return {
-                    "blocks": [
-                        {
-                            "type": "header",
-                            "text": {"type": "plain_text", "text": "Scan Results 📊 (cached)"}
-                        },
-                        {
-                            "type": "section",
-                            "text": {"type": "mrkdwn", "text": 
-                                f"*Directory:* {display_name}\n" +
-                                f"*Total Files:* {total}\n\n" +
-                                "*Files by Age:*\n" +
-                                f"• More than 3 years: {more_than_3y}\n" +
-                                f"• 1-3 years: {one_to_3y}\n" +
-                                f"• Less than 1 year: {less_than_1y}"
-                            }
-                        },
-                        {
-                            "type": "actions",
-                            "elements": [
-                                {
-                                    "type": "button",
-                                    "text": {"type": "plain_text", "text": "View Full Dashboard"},
-                                    "url": f"{self.dashboard_base_url}?directory={directory}"
-                                }
-                            ]
-                        }
-                    ]
-                }
+                return self._build_scan_response(display_name, directory, cached_result.get('stats'), cached=True)
             else:
                 # No cache - need to scan
                 # Try to do a quick scan (with timeout)
-                logger.info(f"Starting scan for directory: {directory}")
+                logger.info("Starting scan for directory: %s", directory)
                 
                 # Start the scan in the background (will continue even if we timeout)
-                import asyncio
-                
                 async def background_scan():
                     """Run scan in background and cache results"""
-                    try:
-                        logger.info(f"Background scan starting for: {directory}")
-                        # Use user-specific chat_service for the scan
-                        results = await user_chat_service.analyze_directory(directory)
-                        logger.info(f"Background scan completed for: {directory}")
-                        # Results are automatically cached by analyze_directory
-                        return results
-                    except Exception as e:
-                        logger.error(f"Background scan failed for {directory}: {str(e)}", exc_info=True)
-                        return None
-                
-                # Create background task that continues after we return
-                scan_task = asyncio.create_task(background_scan())
-                
+                    # The semaphore caps concurrent Drive traversals so a
+                    # burst of scan commands cannot pile up unbounded work.
+                    async with _BG_SCAN_SEMAPHORE:
+                        try:
+                            logger.info("Background scan starting for: %s", directory)
+                            # Use user-specific chat_service for the scan
+                            results = await user_chat_service.analyze_directory(directory)
+                            logger.info("Background scan completed for: %s", directory)
+                            # Results are automatically cached by analyze_directory
+                            return results
+                        except Exception as e:
+                            logger.error(f"Background scan failed for {directory}: {str(e)}", exc_info=True)
+                            return None
+
+                # Reuse an in-flight scan of the same directory rather than
+                # spawning a duplicate; otherwise start one and register it.
+                scan_task = _bg_scan_tasks.get(directory)
+                if scan_task is None or scan_task.done():
+                    scan_task = asyncio.create_task(background_scan())
+                    _bg_scan_tasks[directory] = scan_task
+                    scan_task.add_done_callback(
+                        lambda t, d=directory: _bg_scan_tasks.pop(d, None)
+                    )
+
                 try:
-                    # Try to wait for quick results
-                    results = await asyncio.wait_for(scan_task, timeout=2.5)
+                    # Try to wait for quick results. shield() keeps the shared
+                    # task alive when this caller's wait times out, so other
+                    # waiters (and the cache) still get the result.
+                    results = await asyncio.wait_for(asyncio.shield(scan_task), timeout=2.5)
                     
                     # Check if scan succeeded
                     if not results:
@@ -559,47 +1030,10 @@ class SlackService:
                             "text": f"Error: Could not scan directory '{directory}'. Please check the directory ID."
                         }
                     
-                    # Scan completed quickly! Extract and return results
-                    stats = results.get('stats', {})
-                    by_age = stats.get('by_age_group', {})
-                    
-                    more_than_3y = by_age.get('moreThanThreeYears', 0)
-                    one_to_3y = by_age.get('oneToThreeYears', 0)
-                    less_than_1y = by_age.get('lessThanOneYear', 0)
-                    total = more_than_3y + one_to_3y + less_than_1y
-                    
+                    # Scan completed quickly! Extract and return results.
                     # Show the name if it was resolved, otherwise show the ID
                     display_name = directory_input if directory != directory_input else directory
-                    
-                    return {
-                        "blocks": [
-                            {
-                                "type": "header",
-                                "text": {"type": "plain_text", "text": "Scan Results 📊"}
-                            },
-                            {
-                                "type": "section",
-                                "text": {"type": "mrkdwn", "text": 
-                                    f"*Directory:* {display_name}\n" +
-                                    f"*Total Files:* {total}\n\n" +
-                                    "*Files by Age:*\n" +
-                                    f"• More than 3 years: {more_than_3y}\n" +
-                                    f"• 1-3 years: {one_to_3y}\n" +
-                                    f"• Less than 1 year: {less_than_1y}"
-                                }
-                            },
-                            {
-                                "type": "actions",
-                                "elements": [
-                                    {
-                                        "type": "button",
-                                        "text": {"type": "plain_text", "text": "View Full Dashboard"},
-                                        "url": f"{self.dashboard_base_url}?directory={directory}"
-                                    }
-                                ]
-                            }
-                        ]
-                    }
+                    return self._build_scan_response(display_name, directory, results.get('stats'), cached=False)
                 except asyncio.TimeoutError:
                     # Scan is taking too long, but continues in background
                     logger.warning(f"Scan timeout for directory: {directory}, continuing in background")
@@ -610,9 +1044,9 @@ class SlackService:
                             {
                                 "type": "section",
                                 "text": {"type": "mrkdwn", "text": 
-                                    f"🔄 *Scanning directory:* {display_name}\n\n" +
-                                    "This directory is large and is being scanned in the background.\n\n" +
-                                    f"View results in the dashboard: {self.dashboard_base_url}\n\n" +
+                                    f"🔄 *Scanning directory:* {display_name}\n\n"
+                                    "This directory is large and is being scanned in the background.\n\n"
+                                    f"View results in the dashboard: {self.dashboard_base_url}\n\n"
                                     "💡 _Tip: Run this command again in 30 seconds to see cached results instantly!_"
                                 }
                             }
@@ -620,8 +1054,17 @@ class SlackService:
                     }
                     
         except Exception as e:
-            logger.error(f"Error in scan command: {str(e)}", exc_info=True)
-            return {"response_type": "ephemeral", "text": f"Error scanning directory: {str(e)}"}
+            error_msg = str(e)
+            # Expected failure (bad directory name/ID from the user): no
+            # point paying traceback formatting for it on every miss.
+            if "notFound" in error_msg or "File not found" in error_msg:
+                logger.warning("Directory not found: %s", directory_input)
+                return {
+                    "response_type": "ephemeral",
+                    "text": f"Directory not found: {directory_input}. Use `/zo list` to see available directories."
+                }
+            logger.error(f"Error in scan command: {error_msg}", exc_info=True)
+            return {"response_type": "ephemeral", "text": f"Error scanning directory: {error_msg}"}
 
     async def _handle_risks(self, args: List[str], user_id: str, channel_id: str, user_chat_service: ChatService) -> Dict:
         if not args:
@@ -636,7 +1079,7 @@ class SlackService:
             risks = await user_chat_service.analyze_risks(directory)
             
             # Just point to the main dashboard
-            dashboard_url = f"{self.dashboard_base_url}"
+            dashboard_url = self.dashboard_base_url
             
             return {
                 "blocks": [
@@ -670,47 +1113,22 @@ class SlackService:
             # Get drive statistics from chat service
             stats = await user_chat_service.get_drive_stats()
             
-            # Get urgent items (highest priority)
-            urgent_items = self._get_urgent_items(stats)
+            # Format hot items with priority indicators in a single pass
+            # over the generator - no intermediate list, no second loop
+            hot_items_text = "\n".join(f"🔥 {item}" for item in self._iter_urgent_items(stats))
             
             # Create hot items message
-            if not urgent_items:
-                return {
-                    "blocks": [
-                        {
-                            "type": "header",
-                            "text": {"type": "plain_text", "text": "🔥 Hot Items - All Clear!"}
-                        },
-                        {
-                            "type": "section",
-                            "text": {"type": "mrkdwn", "text": "No urgent items found. Your drive is in good shape! 🎉"}
-                        }
-                    ]
-                }
-            
-            # Format hot items with priority indicators
-            hot_items_text = "\n".join(f"🔥 {item}" for item in urgent_items)
+            if not hot_items_text:
+                return _HOT_ALL_CLEAR_RESPONSE
             
             return {
                 "blocks": [
-                    {
-                        "type": "header",
-                        "text": {"type": "plain_text", "text": "🔥 Hot Items - Immediate Attention Required"}
-                    },
+                    _HOT_HEADER_BLOCK,
                     {
                         "type": "section",
                         "text": {"type": "mrkdwn", "text": f"*Priority Items:*\n{hot_items_text}"}
                     },
-                    {
-                        "type": "actions",
-                        "elements": [
-                            {
-                                "type": "button",
-                                "text": {"type": "plain_text", "text": "View Full Analysis"},
-                                "url": f"{self.dashboard_base_url}"
-                            }
-                        ]
-                    }
+                    _HOT_ACTIONS_BLOCK
                 ]
             }
         except Exception as e:
@@ -728,24 +1146,12 @@ class SlackService:
             
             return {
                 "blocks": [
-                    {
-                        "type": "header",
-                        "text": {"type": "plain_text", "text": "🤖 AI Recommendations"}
-                    },
+                    _SUGGEST_HEADER_BLOCK,
                     {
                         "type": "section",
                         "text": {"type": "mrkdwn", "text": recommendations}
                     },
-                    {
-                        "type": "actions",
-                        "elements": [
-                            {
-                                "type": "button",
-                                "text": {"type": "plain_text", "text": "View Detailed Analysis"},
-                                "url": f"{self.dashboard_base_url}"
-                            }
-                        ]
-                    }
+                    _SUGGEST_ACTIONS_BLOCK
                 ]
             }
         except Exception as e:
@@ -760,24 +1166,12 @@ class SlackService:
             
             return {
                 "blocks": [
-                    {
-                        "type": "header",
-                        "text": {"type": "plain_text", "text": "⚙️ Automation Center"}
-                    },
+                    _AUTOMATE_HEADER_BLOCK,
                     {
                         "type": "section",
                         "text": {"type": "mrkdwn", "text": automation_options}
                     },
-                    {
-                        "type": "actions",
-                        "elements": [
-                            {
-                                "type": "button",
-                                "text": {"type": "plain_text", "text": "Configure Automation"},
-                                "url": f"{self.dashboard_base_url}"
-                            }
-                        ]
-                    }
+                    _AUTOMATE_ACTIONS_BLOCK
                 ]
             }
         except Exception as e:
@@ -786,154 +1180,100 @@ class SlackService:
 
     def _calculate_health_score(self, stats: Dict[str, Any]) -> int:
         """Calculate health score based on multiple factors with weighted scoring"""
-        weights = {
-            'sensitive_docs': 0.4,  # 40% weight - most important
-            'old_files': 0.3,       # 30% weight - important for cleanup
-            'storage_usage': 0.3    # 30% weight - important for capacity
-        }
-        
-        # Calculate individual scores (0-100 scale)
-        sensitive_score = self._score_sensitive_docs(stats.get('sensitive_files', 0))
-        old_files_score = self._score_old_files(stats.get('old_files', 0))
-        storage_score = self._score_storage(stats.get('storage_used_percentage', 0))
-        
-        # Weighted average
+        st = _extract_stats(stats)
+
+        # Weighted average: sensitive docs 40% (most important),
+        # old files 30% (cleanup), storage 30% (capacity)
         total_score = (
-            sensitive_score * weights['sensitive_docs'] +
-            old_files_score * weights['old_files'] +
-            storage_score * weights['storage_usage']
+            self._score_sensitive_docs(st.sensitive_files) * 0.4 +
+            self._score_old_files(st.old_files) * 0.3 +
+            self._score_storage(st.storage_used_percentage) * 0.3
         )
         
         return int(round(total_score))
 
-    def _score_sensitive_docs(self, sensitive_count: int) -> int:
+    @staticmethod
+    def _score_sensitive_docs(sensitive_count: int) -> int:
         """Score based on sensitive documents (0-100, higher is better)"""
-        if sensitive_count == 0:
-            return 100
-        elif sensitive_count <= 5:
-            return 80
-        elif sensitive_count <= 10:
-            return 60
-        elif sensitive_count <= 20:
-            return 40
-        else:
-            return 20
-
-    def _score_old_files(self, old_files_count: int) -> int:
+        return _SENSITIVE_SCORES[bisect_left(_SENSITIVE_THRESHOLDS, sensitive_count)]
+
+    @staticmethod
+    def _score_old_files(old_files_count: int) -> int:
         """Score based on old files (0-100, higher is better)"""
-        if old_files_count == 0:
-            return 100
-        elif old_files_count <= 10:
-            return 90
-        elif old_files_count <= 25:
-            return 70
-        elif old_files_count <= 50:
-            return 50
-        elif old_files_count <= 100:
-            return 30
-        else:
-            return 10
-
-    def _score_storage(self, storage_percentage: float) -> int:
+        return _OLD_FILES_SCORES[bisect_left(_OLD_FILES_THRESHOLDS, old_files_count)]
+
+    @staticmethod
+    def _score_storage(storage_percentage: float) -> int:
         """Score based on storage usage (0-100, higher is better)"""
-        if storage_percentage <= 50:
-            return 100
-        elif storage_percentage <= 70:
-            return 80
-        elif storage_percentage <= 80:
-            return 60
-        elif storage_percentage <= 90:
-            return 40
-        else:
-            return 20
-
-    def _get_urgent_items(self, stats: Dict[str, Any]) -> List[str]:
-        """Get urgent items that need immediate attention, prioritized by severity"""
-        urgent_items = []
-        
-        sensitive_files = stats.get('sensitive_files', 0)
-        old_files = stats.get('old_files', 0)
-        storage_used = stats.get('storage_used_percentage', 0)
-        total_files = stats.get('total_files', 0)
-        
-        # High priority: Security issues
-        if sensitive_files > 0:
-            if sensitive_files > 10:
-                urgent_items.append(f"🚨 CRITICAL: {sensitive_files} sensitive files need immediate review")
-            elif sensitive_files > 5:
-                urgent_items.append(f"🔒 HIGH: {sensitive_files} sensitive files need review")
-            else:
-                urgent_items.append(f"🔒 {sensitive_files} sensitive files need review")
-        
-        # Medium priority: Storage issues
-        if storage_used > 90:
-            urgent_items.append(f"💾 CRITICAL: Storage at {storage_used}% - immediate cleanup needed")
-        elif storage_used > 80:
-            urgent_items.append(f"💾 HIGH: Storage at {storage_used}% - cleanup recommended")
-        elif storage_used > 70:
-            urgent_items.append(f"💾 Storage usage is at {storage_used}%")
-        
-        # Lower priority: Old files (only if significant)
-        if old_files > 50:
-            urgent_items.append(f"📅 {old_files} files are over 3 years old - consider archiving")
-        elif old_files > 20:
-            urgent_items.append(f"📅 {old_files} files are over 3 years old")
-        
+        return _STORAGE_SCORES[bisect_left(_STORAGE_THRESHOLDS, storage_percentage)]
+
+    @staticmethod
+    def _iter_urgent_items(stats: Dict[str, Any]):
+        """Yield urgent items that need immediate attention, prioritized by
+        severity. A generator so consumers can format and join in one pass
+        without an intermediate list."""
+        st = _extract_stats(stats)
+
+        # Severity order: security, then storage, then old files
+        for item in (
+            _first_tier(st.sensitive_files, _SENSITIVE_TIERS),
+            _first_tier(st.storage_used_percentage, _STORAGE_TIERS),
+            _first_tier(st.old_files, _OLD_FILES_TIERS),
+        ):
+            if item is not None:
+                yield item
+
         # Additional insights
-        if total_files > 0:
-            old_ratio = (old_files / total_files) * 100
+        if st.total_files > 0:
+            old_ratio = (st.old_files / st.total_files) * 100
             if old_ratio > 50:
-                urgent_items.append(f"📊 {old_ratio:.1f}% of files are outdated")
-        
-        return urgent_items
+                yield f"📊 {old_ratio:.1f}% of files are outdated"
+
+    @staticmethod
+    def _get_urgent_items(stats: Dict[str, Any]) -> List[str]:
+        """Get urgent items that need immediate attention, prioritized by severity"""
+        return list(SlackService._iter_urgent_items(stats))
 
     def _format_risks(self, risks: Dict[str, Any]) -> str:
-        return (
-            f"*Risk Summary:*\n" +
-            f"• Sensitive Files: {risks.get('sensitive_files', 0)}\n" +
-            f"• High Risk: {risks.get('high_risk', 0)}\n" +
-            f"• Medium Risk: {risks.get('medium_risk', 0)}\n" +
-            f"• Low Risk: {risks.get('low_risk', 0)}\n\n" +
-            "*Top Concerns:*\n" +
-            "\n".join(f"• {concern}" for concern in risks.get('top_concerns', []))
-        )
+        # One list, one join: the output buffer is sized once in C instead
+        # of allocating an intermediate string per line.
+        parts = [
+            "*Risk Summary:*",
+            f"• Sensitive Files: {risks.get('sensitive_files', 0)}",
+            f"• High Risk: {risks.get('high_risk', 0)}",
+            f"• Medium Risk: {risks.get('medium_risk', 0)}",
+            f"• Low Risk: {risks.get('low_risk', 0)}",
+            "",
+            "*Top Concerns:*"
+        ]
+        parts.extend(f"• {concern}" for concern in risks.get('top_concerns', ()))
+        return "\n".join(parts)
 
     def _create_risks_summary(self, stats: Dict[str, Any], dashboard_url: str) -> Dict:
         """Create a security-focused summary"""
-        sensitive_files = stats.get('sensitive_files', 0)
-        old_files = stats.get('old_files', 0)
-        total_files = stats.get('total_files', 0)
+        st = _extract_stats(stats)
         
         risk_level = "Low"
-        if sensitive_files > 10 or old_files > 50:
+        if st.sensitive_files > 10 or st.old_files > 50:
             risk_level = "High"
-        elif sensitive_files > 0 or old_files > 20:
+        elif st.sensitive_files > 0 or st.old_files > 20:
             risk_level = "Medium"
         
         return {
             "blocks": [
-                {
-                    "type": "header",
-                    "text": {"type": "plain_text", "text": "Security Summary 🔒"}
-                },
+                _RISKS_HEADER_BLOCK,
                 {
                     "type": "section",
-                    "text": {"type": "mrkdwn", "text": 
-                        f"*Risk Level:* {risk_level}\n" +
-                        f"*Sensitive Files:* {sensitive_files}\n" +
-                        f"*Old Files (>3y):* {old_files}\n" +
-                        f"*Total Files:* {total_files}"
+                    "text": {"type": "mrkdwn", "text":
+                        f"*Risk Level:* {risk_level}\n"
+                        f"*Sensitive Files:* {st.sensitive_files}\n"
+                        f"*Old Files (>3y):* {st.old_files}\n"
+                        f"*Total Files:* {st.total_files}"
                     }
                 },
                 {
                     "type": "actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {"type": "plain_text", "text": "View Security Details"},
-                            "url": dashboard_url
-                        }
-                    ]
+                    "elements": [{**_SECURITY_BUTTON, "url": dashboard_url}]
                 }
             ]
         }
@@ -941,13 +1281,15 @@ class SlackService:
     # NOTE: _handle_risks, _handle_hot, and _handle_suggest are kept for future use
     # They are not currently registered in the command handler but can be added later
 
-    def _generate_recommendations(self, stats: Dict[str, Any]) -> str:
+    @staticmethod
+    def _generate_recommendations(stats: Dict[str, Any]) -> str:
         """Generate AI-powered recommendations based on drive statistics"""
         recommendations = []
         
-        sensitive_files = stats.get('sensitive_files', 0)
-        old_files = stats.get('old_files', 0)
-        storage_used = stats.get('storage_used_percentage', 0)
+        st = _extract_stats(stats)
+        sensitive_files = st.sensitive_files
+        old_files = st.old_files
+        storage_used = st.storage_used_percentage
         
         if sensitive_files > 0:
             recommendations.append(f"🔒 *Security Priority:* Review {sensitive_files} sensitive files")
@@ -967,51 +1309,84 @@ class SlackService:
         
         return "\n".join(recommendations)
 
-    def _get_automation_options(self) -> str:
+    @staticmethod
+    def _get_automation_options() -> str:
         """Get available automation options"""
-        return (
-            "*Available Automations:*\n" +
-            "• 🔄 Auto-archive files older than 3 years\n" +
-            "• 🔒 Flag sensitive documents for review\n" +
-            "• 📊 Weekly storage usage reports\n" +
-            "• 🚨 Alert on unusual access patterns\n" +
-            "• 🗑️ Suggest duplicate file removal\n\n" +
-            "*Coming Soon:*\n" +
-            "• 📅 Scheduled cleanup workflows\n" +
-            "• 🤖 AI-powered content categorization\n" +
-            "• 📧 Email digest notifications"
-        )
+        return _AUTOMATION_OPTIONS_TEXT
 
     async def send_message(self, channel: str, text: str) -> None:
         """Send a message to a Slack channel"""
         try:
-            response = self.client.chat_postMessage(
+            _ensure_slack_session()
+            response = await self.client.chat_postMessage(
                 channel=channel,
                 text=text
             )
-            logger.debug(f"Message sent to channel {channel}")
+            logger.debug("Message sent to channel %s", channel)
         except SlackApiError as e:
-            logger.error(f"Error sending message: {str(e)}", exc_info=True)
+            # Slack already classified the failure; the error code says it
+            # all and the traceback through the SDK adds only formatting cost.
+            logger.error("Error sending message to %s: %s", channel, e)
+
+    async def send_messages(self, messages: List[Tuple[str, str]]) -> None:
+        """
+        Send several (channel, text) messages concurrently.
+        Deliveries overlap up to the shared semaphore limit, so a fan-out
+        to K channels costs roughly one round trip instead of K.
+        """
+        async def _bounded(channel: str, text: str) -> None:
+            async with _SEND_SEMAPHORE:
+                await self.send_message(channel, text)
+
+        await asyncio.gather(*(_bounded(channel, text) for channel, text in messages))
+
+    async def _get_channel_id_map(self) -> Dict[str, str]:
+        """
+        Return the cached {channel_name: channel_id} mapping, refreshing it
+        from conversations_list (paginated) when stale. One listing every
+        few minutes replaces a 200-channel fetch per notification.
+        """
+        global _channel_cache_expires
+        now = time.monotonic()
+        if now < _channel_cache_expires and _channel_id_cache:
+            return _channel_id_cache
+        mapping: Dict[str, str] = {}
+        cursor = None
+        while True:
+            result = await self.client.conversations_list(
+                types="public_channel,private_channel", limit=200, cursor=cursor
+            )
+            for ch in result.get("channels", []):
+                mapping[ch["name"]] = ch["id"]
+            cursor = result.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+        _channel_id_cache.clear()
+        _channel_id_cache.update(mapping)
+        _channel_cache_expires = now + _CHANNEL_CACHE_TTL
+        return _channel_id_cache
 
     async def send_notification_blocks(self, channel: str, blocks: List[Dict]) -> None:
         """Send formatted blocks to a Slack channel"""
         try:
-            logger.info(f"Attempting to send notification to channel: {channel}")
-            logger.debug(f"Notification blocks: {json.dumps(blocks, indent=2)}")
+            _ensure_slack_session()
+            logger.info("Attempting to send notification to channel: %s", channel)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Notification blocks: %s", json.dumps(blocks, separators=(",", ":")))
             
             # Try to find channel by name first, then by ID
             # Slack API accepts channel names without # prefix
             channel_id = channel
-            if not channel.startswith('C') and len(channel) < 20:  # Not a channel ID (IDs start with C and are longer)
-                # Try to resolve channel name to ID
+            if not _CHANNEL_ID_RE.match(channel):  # Not a conversation ID
+                # Try to resolve channel name to ID via the cached mapping;
+                # a hit skips the conversations_list round trip entirely.
                 try:
-                    # First, try without # prefix
-                    result = self.client.conversations_list(types="public_channel,private_channel", limit=200)
-                    for ch in result.get("channels", []):
-                        if ch["name"] == channel or ch["name"] == channel.lstrip("#"):
-                            channel_id = ch["id"]
-                            logger.info(f"Resolved channel name '{channel}' to ID: {channel_id}")
-                            break
+                    name = channel.lstrip("#")
+                    mapping = await self._get_channel_id_map()
+                    resolved = mapping.get(name)
+                    if resolved is not None:
+                        channel_id = resolved
+                        logger.info("Resolved channel name '%s' to ID: %s", channel, channel_id)
                     else:
                         logger.warning(f"Channel '{channel}' not found in workspace. Make sure:")
                         logger.warning(f"  1. The channel exists")
@@ -1020,11 +1395,11 @@ class SlackService:
                 except Exception as e:
                     logger.warning(f"Could not resolve channel name '{channel}' to ID: {e}, using as-is")
             
-            response = self.client.chat_postMessage(
+            response = await self.client.chat_postMessage(
                 channel=channel_id,
                 blocks=blocks
             )
-            logger.debug(f"Notification sent successfully to channel {channel_id} (name: {channel})")
+            logger.debug("Notification sent successfully to channel %s (name: %s)", channel_id, channel)
             return response
         except SlackApiError as e:
             error_code = e.response.get("error", "unknown") if e.response else "unknown"
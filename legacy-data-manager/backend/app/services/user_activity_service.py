@@ -3,15 +3,75 @@ User Activity Tracking Service
 
 Tracks all user activities for audit trail and analytics.
 """
+from collections import deque
 from typing import Optional, Dict, Any
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from ..db.models import UserActivity, WebUser
 from datetime import datetime
+import json
 import logging
 import re
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Batched activity writes: record_activity appends a plain mapping to this
+# queue and returns immediately; a daemon thread drains it with one bulk
+# insert per batch. One deque append (~µs) replaces a commit+fsync (~ms)
+# per event, which is what keeps tracking off the main flow's critical path.
+_activity_queue: "deque[Dict[str, Any]]" = deque()
+_flush_wakeup = threading.Event()
+_flusher_lock = threading.Lock()
+_flusher_started = False
+_FLUSH_INTERVAL = 0.5   # seconds between idle flush checks
+_FLUSH_BATCH = 500      # max rows per bulk insert
+
+# user_id -> (email, cached_at): avoids a WebUser SELECT per recorded event
+# when callers pass only user_id. Emails effectively never change, but a
+# short TTL keeps a rename from sticking for long.
+_email_by_user_id: Dict[int, tuple] = {}
+_EMAIL_LOOKUP_TTL = 300.0
+
+
+def _flush_pending() -> None:
+    """Drain the queue into the database in batches. Runs on the flusher
+    thread with its own short-lived session per flush."""
+    from ..db.database import SessionLocal
+
+    while _activity_queue:
+        batch = []
+        while _activity_queue and len(batch) < _FLUSH_BATCH:
+            batch.append(_activity_queue.popleft())
+        session = SessionLocal()
+        try:
+            session.bulk_insert_mappings(UserActivity, batch)
+            session.commit()
+        except Exception as e:
+            logger.error(f"Error flushing {len(batch)} activity records: {e}", exc_info=True)
+            session.rollback()
+        finally:
+            session.close()
+
+
+def _flush_loop() -> None:
+    while True:
+        _flush_wakeup.wait(_FLUSH_INTERVAL)
+        _flush_wakeup.clear()
+        _flush_pending()
+
+
+def _ensure_flusher() -> None:
+    """Start the flusher thread once, on first use."""
+    global _flusher_started
+    if _flusher_started:
+        return
+    with _flusher_lock:
+        if not _flusher_started:
+            threading.Thread(target=_flush_loop, name="activity-flusher", daemon=True).start()
+            _flusher_started = True
+
 
 class UserActivityService:
     """Service for tracking user activities"""
@@ -36,7 +96,7 @@ class UserActivityService:
         status: Optional[str] = None,
         error_message: Optional[str] = None,
         duration_ms: Optional[int] = None
-    ) -> UserActivity:
+    ) -> None:
         """
         Record a user activity event.
         
@@ -58,55 +118,60 @@ class UserActivityService:
             duration_ms: Duration of the action in milliseconds
         
         Returns:
-            UserActivity: The created activity record
+            None. The record is queued and written in the background.
         """
         try:
-            # If user_id provided but email not, try to get email
+            # If user_id provided but email not, try to get email (cached,
+            # single-column SELECT - no full-row hydration per event)
             if user_id and not user_email:
-                user = self.db.query(WebUser).filter(WebUser.id == user_id).first()
-                if user:
-                    user_email = user.email
-            
-            activity = UserActivity(
-                user_id=user_id,
-                user_email=user_email,
-                slack_user_id=slack_user_id,
-                event_type=event_type,
-                action=action,
-                resource_type=resource_type,
-                resource_id=resource_id,
-                source=source,
-                ip_address=ip_address,
-                user_agent=user_agent,
-                trace_id=trace_id,
-                status=status,
-                error_message=error_message,
-                duration_ms=duration_ms,
-                created_at=datetime.utcnow()
-            )
-            
-            # Store metadata as JSON
-            if metadata:
-                activity.set_metadata(metadata)
+                user_email = self._lookup_email(user_id)
             
             # Sanitize error message to prevent information leakage
-            if activity.error_message:
-                activity.error_message = self._sanitize_error_message(activity.error_message)
-            
-            self.db.add(activity)
-            self.db.commit()
-            self.db.refresh(activity)
+            if error_message:
+                error_message = self._sanitize_error_message(error_message)
             
-            logger.debug(f"Recorded activity: {event_type} - {action} by user {user_id or user_email}")
+            # Queue a plain column mapping; the flusher thread bulk-inserts
+            # batches with its own session so this call never blocks on a
+            # commit round trip.
+            _activity_queue.append({
+                "user_id": user_id,
+                "user_email": user_email,
+                "slack_user_id": slack_user_id,
+                "event_type": event_type,
+                "action": action,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "source": source,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "trace_id": trace_id,
+                "status": status,
+                "error_message": error_message,
+                "duration_ms": duration_ms,
+                "metadata_json": json.dumps(metadata) if metadata else None,
+                "created_at": datetime.utcnow()
+            })
+            _ensure_flusher()
+            if len(_activity_queue) >= _FLUSH_BATCH:
+                _flush_wakeup.set()
             
-            return activity
+            logger.debug(f"Queued activity: {event_type} - {action} by user {user_id or user_email}")
             
         except Exception as e:
             logger.error(f"Error recording user activity: {e}", exc_info=True)
-            self.db.rollback()
             # Don't raise - activity tracking shouldn't break the main flow
-            return None
     
+    def _lookup_email(self, user_id: int) -> Optional[str]:
+        """Resolve a user's email for denormalized storage, caching the
+        result so bursts of events don't repeat the SELECT."""
+        cached = _email_by_user_id.get(user_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < _EMAIL_LOOKUP_TTL:
+            return cached[0]
+        email = self.db.query(WebUser.email).filter(WebUser.id == user_id).scalar()
+        _email_by_user_id[user_id] = (email, now)
+        return email
+
     def _sanitize_error_message(self, error_msg: str) -> str:
         """
         Sanitize error messages to prevent information leakage.
@@ -168,6 +233,43 @@ class UserActivityService:
         
         return query.order_by(UserActivity.created_at.desc()).offset(offset).limit(limit).all()
     
+    def get_user_activity_rows(
+        self,
+        user_id: Optional[int] = None,
+        user_email: Optional[str] = None,
+        event_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> list:
+        """
+        Like get_user_activities, but returns lightweight Row tuples with
+        just the summary columns instead of fully hydrated ORM objects -
+        much cheaper for audit listings that only display a few fields.
+        
+        Returns:
+            List of (id, event_type, action, source, status, created_at) rows
+        """
+        stmt = select(
+            UserActivity.id,
+            UserActivity.event_type,
+            UserActivity.action,
+            UserActivity.source,
+            UserActivity.status,
+            UserActivity.created_at,
+        )
+        
+        if user_id:
+            stmt = stmt.where(UserActivity.user_id == user_id)
+        elif user_email:
+            stmt = stmt.where(UserActivity.user_email == user_email)
+        
+        if event_type:
+            stmt = stmt.where(UserActivity.event_type == event_type)
+        
+        stmt = stmt.order_by(UserActivity.created_at.desc()).offset(offset).limit(limit)
+        # Stream in chunks rather than buffering the whole page at once
+        return self.db.execute(stmt.execution_options(yield_per=1000)).all()
+    
     def get_activity_stats(
         self,
         user_id: Optional[int] = None,
@@ -184,28 +286,33 @@ class UserActivityService:
             Dictionary with activity statistics
         """
         from datetime import timedelta
-        
+
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        query = self.db.query(UserActivity).filter(UserActivity.created_at >= cutoff_date)
-        
+
+        # Tally in the database with GROUP BY instead of hydrating every
+        # activity row into Python: only the (key, count) pairs come back,
+        # so cost scales with the number of distinct keys, not the window.
+        filters = [UserActivity.created_at >= cutoff_date]
         if user_id:
-            query = query.filter(UserActivity.user_id == user_id)
-        
-        activities = query.all()
-        
-        # Count by event type
-        event_counts = {}
-        action_counts = {}
-        source_counts = {}
-        
-        for activity in activities:
-            event_counts[activity.event_type] = event_counts.get(activity.event_type, 0) + 1
-            action_counts[activity.action] = action_counts.get(activity.action, 0) + 1
-            if activity.source:
-                source_counts[activity.source] = source_counts.get(activity.source, 0) + 1
-        
+            filters.append(UserActivity.user_id == user_id)
+
+        def _group_counts(column):
+            rows = (
+                self.db.query(column, func.count())
+                .filter(*filters)
+                .group_by(column)
+                .all()
+            )
+            return dict(rows)
+
+        event_counts = _group_counts(UserActivity.event_type)
+        action_counts = _group_counts(UserActivity.action)
+        source_counts = _group_counts(UserActivity.source)
+        # Activities without a source were never counted; drop the NULL bucket.
+        source_counts.pop(None, None)
+
         return {
-            "total_activities": len(activities),
+            "total_activities": sum(event_counts.values()),
             "event_type_counts": event_counts,
             "action_counts": action_counts,
             "source_counts": source_counts,
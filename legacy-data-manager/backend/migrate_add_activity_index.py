@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the (user_id, created_at) composite index on
+user_activities, used by the per-user listing and stats queries.
+Handles both SQLite and PostgreSQL databases.
+"""
+import os
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+
+load_dotenv()
+
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./legacy_data.db")
+
+INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS ix_user_activities_user_created 
+    ON user_activities(user_id, created_at)
+"""
+
+def main():
+    """Run the migration"""
+    print(f"Connecting to database: {SQLALCHEMY_DATABASE_URL.split('@')[-1] if '@' in SQLALCHEMY_DATABASE_URL else SQLALCHEMY_DATABASE_URL}")
+    
+    if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+        engine = create_engine(
+            SQLALCHEMY_DATABASE_URL,
+            connect_args={"check_same_thread": False}
+        )
+    else:
+        engine = create_engine(SQLALCHEMY_DATABASE_URL)
+    
+    with engine.connect() as conn:
+        try:
+            conn.execute(text(INDEX_SQL))
+            conn.commit()
+            print("✅ Successfully ensured ix_user_activities_user_created index")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            conn.rollback()
+            raise
+    
+    print("Migration complete!")
+
+if __name__ == "__main__":
+    main()
@@ -18,11 +18,14 @@ def migrate_sqlite(engine):
     conn = engine.raw_connection()
     cursor = conn.cursor()
     try:
-        # Check if column already exists
-        cursor.execute("PRAGMA table_info(user_activities)")
-        columns = [row[1] for row in cursor.fetchall()]
+        # Check if column already exists (short-circuits on first match
+        # instead of materializing the full column list)
+        has_column = any(
+            col['name'] == 'trace_id'
+            for col in inspect(engine).get_columns('user_activities')
+        )
         
-        if 'trace_id' not in columns:
+        if not has_column:
             print("Adding trace_id column to user_activities table...")
             cursor.execute("ALTER TABLE user_activities ADD COLUMN trace_id VARCHAR")
             
@@ -47,15 +50,18 @@ def migrate_postgresql(engine):
     """Add trace_id column to PostgreSQL database"""
     with engine.connect() as conn:
         try:
-            # Check if column already exists
-            result = conn.execute(text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'user_activities' 
-                AND column_name = 'trace_id'
-            """))
+            # Check if column already exists; EXISTS stops at the first
+            # match and scalar() returns the boolean directly
+            has_column = conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 
+                    FROM information_schema.columns 
+                    WHERE table_name = 'user_activities' 
+                    AND column_name = 'trace_id'
+                )
+            """)).scalar()
             
-            if result.fetchone() is None:
+            if not has_column:
                 print("Adding trace_id column to user_activities table...")
                 conn.execute(text("""
                     ALTER TABLE user_activities 
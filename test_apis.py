@@ -7,19 +7,25 @@ Tests the basic API endpoints to ensure they're working correctly
 import requests
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:8000"
 API_BASE = f"{BASE_URL}/api/v1"
 
+# One shared session so every probe reuses the same keep-alive connection
+# instead of paying a TCP handshake per request.
+SESSION = requests.Session()
+SESSION.headers.update({"Connection": "keep-alive"})
+
 def test_endpoint(method, endpoint, description, data=None, headers=None):
     """Test a single endpoint and return results"""
     url = f"{API_BASE}{endpoint}" if endpoint.startswith('/') else f"{API_BASE}/{endpoint}"
     
     try:
         if method.upper() == "GET":
-            response = requests.get(url, headers=headers, timeout=5)
+            response = SESSION.get(url, headers=headers, timeout=5)
         elif method.upper() == "POST":
-            response = requests.post(url, json=data, headers=headers, timeout=5)
+            response = SESSION.post(url, json=data, headers=headers, timeout=5)
         else:
             return False, f"Unsupported method: {method}"
         
@@ -46,14 +52,22 @@ def main():
         ("GET", "/chat/status", "Chat service status", None),
     ]
     
+    # Probe all endpoints concurrently - they're independent, the Session
+    # is thread-safe, and sockets release the GIL - so wall time is the
+    # slowest probe instead of the sum. Output order follows submit order.
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        futures = [
+            executor.submit(test_endpoint, method, endpoint, description, data)
+            for method, endpoint, description, data in test_cases
+        ]
+        outcomes = [future.result() for future in futures]
+    
     results = []
     
-    for method, endpoint, description, data in test_cases:
+    for (method, endpoint, description, data), (success, message) in zip(test_cases, outcomes):
         print(f"\n📋 Testing: {description}")
         print(f"   {method} {API_BASE}{endpoint}")
         
-        success, message = test_endpoint(method, endpoint, description, data)
-        
         if success:
             print(f"   ✅ Success: {message}")
         else:
@@ -6,181 +6,253 @@ Uses FastAPI's built-in TestClient to test our APIs without external dependencie
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'legacy-data-manager/backend'))
+from urllib.parse import urlencode
 
-from fastapi.testclient import TestClient
-from app.main import app
+# Guard the append so repeated imports (e.g. under a test runner) don't
+# grow sys.path with duplicate entries that slow every later import scan.
+_BACKEND_PATH = os.path.join(os.path.dirname(__file__), 'legacy-data-manager/backend')
+if _BACKEND_PATH not in sys.path:
+    sys.path.append(_BACKEND_PATH)
+
+from dataclasses import dataclass, field
+
+import asyncio
+import httpx
 import json
 
-def test_fastapi_endpoints():
-    """Test FastAPI endpoints using TestClient"""
-    
+# Response snippets are diagnostics, not assertions: only pay for
+# rendering them when explicitly asked.
+VERBOSE = os.environ.get("VERBOSE", "").lower() in ("1", "true", "yes")
+
+# Slack command payload, form-encoded once at import: the POST passes
+# the prepared bytes directly instead of re-urlencoding a dict per call.
+SLACK_BODY = urlencode({
+    "text": "help",
+    "channel_id": "test_channel",
+    "user_id": "test_user",
+    "team_id": "test_team"
+}).encode()
+SLACK_HEADERS = {"content-type": "application/x-www-form-urlencoded"}
+
+# 401 is expected without a valid Slack signature; either way the
+# endpoint is reachable.
+OK_SLACK_STATUSES = frozenset({200, 401})
+
+# Single ASGI transport shared by every async client in this script:
+# the transport is stateless per request, so clients can share it
+# instead of each wrapping the app in its own instance. Built lazily so
+# merely importing this module (e.g. during pytest collection) doesn't
+# pay for full FastAPI app construction.
+_asgi_transport = None
+
+def _get_transport():
+    """Import the app and build the shared ASGI transport on first use."""
+    global _asgi_transport
+    if _asgi_transport is None:
+        from app.main import app
+
+        # Generating the OpenAPI schema is the most expensive part of the
+        # /openapi.json and /docs probes. Build it once up front; FastAPI
+        # caches the result, so those probes serve the cached schema.
+        app.openapi()
+        _asgi_transport = httpx.ASGITransport(app=app)
+    return _asgi_transport
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """One endpoint probe. Frozen and slotted: cases are built once at
+    import and shared read-only across the run."""
+    method: str
+    endpoint: str
+    description: str
+    expected_status: int
+    # Set when the check inspects the full body. Other cases are sent as
+    # streaming requests and read at most one small chunk, so the client
+    # never buffers the payload. (HEAD is not an option here: FastAPI
+    # route decorators register only the declared method, so HEAD 405s.)
+    body_needed: bool = False
+    # Report header, formatted once at construction instead of per run.
+    header: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "header",
+            f"\n📋 Testing: {self.description}\n   {self.method} {self.endpoint}"
+        )
+
+    def status_only(self) -> bool:
+        """True when a snippet-sized read suffices for this probe."""
+        return not self.body_needed
+
+TEST_CASES = (
+    Case("GET", "/", "Root endpoint", 200),
+    Case("GET", "/api/v1/slack/test", "Slack test endpoint", 200),
+    Case("GET", "/api/v1/auth/google/status", "Google auth status", 200),
+    Case("GET", "/api/v1/drive/files", "Drive files endpoint", 200),
+    Case("GET", "/api/v1/chat/status", "Chat service status", 200),
+    Case("GET", "/docs", "API documentation", 200),
+    Case("GET", "/openapi.json", "OpenAPI schema", 200),
+)
+
+# Method name -> client method name: one dict lookup per request instead
+# of an if/elif chain, and adding a method is a table entry, not a branch.
+_METHOD_DISPATCH = {"GET": "get", "POST": "post"}
+
+async def _send_request(async_client, case):
+    """Issue a single probe; raises for unsupported methods."""
+    requester_name = _METHOD_DISPATCH.get(case.method)
+    if requester_name is None:
+        raise ValueError(f"Unsupported method: {case.method}")
+    if case.status_only():
+        # Stream and read at most one small chunk: enough for snippets
+        # and failure diagnostics without materializing the full body
+        # (tens of KB for /openapi.json) in the client.
+        request = async_client.build_request(case.method, case.endpoint)
+        response = await async_client.send(request, stream=True)
+        try:
+            first = b""
+            async for chunk in response.aiter_raw(_SNIPPET_BYTES):
+                if chunk:  # some responses lead with an empty chunk
+                    first = chunk
+                    break
+        finally:
+            await response.aclose()
+        response.extensions["snippet"] = first.decode("utf-8", "replace")
+        return response
+    return await getattr(async_client, requester_name)(case.endpoint)
+
+# How much of a streamed body to keep for report snippets.
+_SNIPPET_BYTES = 256
+
+def _snippet(response, limit):
+    """Response-body excerpt for diagnostics; streamed probes keep only
+    their first chunk, fully-read responses fall back to .text."""
+    snippet = response.extensions.get("snippet")
+    if snippet is None:
+        snippet = response.text
+    return snippet[:limit]
+
+async def test_fastapi_endpoints(async_client):
+    """Test FastAPI endpoints concurrently via the ASGI transport"""
+
     print("🧪 Testing FastAPI Endpoints with TestClient")
     print("=" * 50)
-    
-    # Create TestClient
-    client = TestClient(app)
-    
-    # Test cases
-    test_cases = [
-        {
-            "method": "GET",
-            "endpoint": "/",
-            "description": "Root endpoint",
-            "expected_status": 200
-        },
-        {
-            "method": "GET", 
-            "endpoint": "/api/v1/slack/test",
-            "description": "Slack test endpoint",
-            "expected_status": 200
-        },
-        {
-            "method": "GET",
-            "endpoint": "/api/v1/auth/google/status", 
-            "description": "Google auth status",
-            "expected_status": 200
-        },
-        {
-            "method": "GET",
-            "endpoint": "/api/v1/drive/files",
-            "description": "Drive files endpoint", 
-            "expected_status": 200
-        },
-        {
-            "method": "GET",
-            "endpoint": "/api/v1/chat/status",
-            "description": "Chat service status",
-            "expected_status": 200
-        },
-        {
-            "method": "GET",
-            "endpoint": "/docs",
-            "description": "API documentation",
-            "expected_status": 200
-        },
-        {
-            "method": "GET",
-            "endpoint": "/openapi.json",
-            "description": "OpenAPI schema",
-            "expected_status": 200
-        }
-    ]
-    
+
     results = []
-    
-    for test_case in test_cases:
-        method = test_case["method"]
-        endpoint = test_case["endpoint"]
-        description = test_case["description"]
-        expected_status = test_case["expected_status"]
-        
-        print(f"\n📋 Testing: {description}")
-        print(f"   {method} {endpoint}")
-        
-        try:
-            if method == "GET":
-                response = client.get(endpoint)
-            elif method == "POST":
-                response = client.post(endpoint)
-            else:
-                print(f"   ❌ Unsupported method: {method}")
-                results.append((description, False))
-                continue
-            
+    # Tallied during the loop (bool is an int), so the summary needs no
+    # second pass over results.
+    passed = 0
+    total = 0
+    # Buffer the per-case report and write it once: a handful of list
+    # appends instead of several line-buffered stdout writes per case.
+    buf = []
+
+    # Fire all requests at once over the in-process ASGI transport; the
+    # event loop overlaps them so total wall time is roughly the slowest
+    # endpoint rather than the sum of all of them.
+    responses = await asyncio.gather(
+        *(_send_request(async_client, tc) for tc in TEST_CASES),
+        return_exceptions=True
+    )
+
+    for test_case, response in zip(TEST_CASES, responses):
+        description = test_case.description
+        expected_status = test_case.expected_status
+
+        buf.append(test_case.header)
+
+        total += 1
+        if isinstance(response, Exception):
+            buf.append(f"   ❌ Error: {str(response)}")
+            results.append((description, False))
+        else:
             success = response.status_code == expected_status
-            
+
             if success:
-                print(f"   ✅ Success: {response.status_code}")
-                # Show a snippet of the response
-                if hasattr(response, 'json'):
-                    try:
-                        data = response.json()
-                        if isinstance(data, dict) and len(str(data)) < 200:
-                            print(f"   📄 Response: {data}")
-                        else:
-                            print(f"   📄 Response: {str(data)[:100]}...")
-                    except:
-                        print(f"   📄 Response: {response.text[:100]}...")
-                else:
-                    print(f"   📄 Response: {response.text[:100]}...")
+                buf.append(f"   ✅ Success: {response.status_code}")
+                # Show a snippet of the response only when asked: parsing
+                # and re-serializing every body just to print it is wasted
+                # work on the default quiet path. The content-type header
+                # decides the snippet size directly - no parse attempt, no
+                # exception-driven fallback for HTML bodies like /docs.
+                if VERBOSE:
+                    content_type = response.headers.get("content-type", "")
+                    limit = 200 if content_type.startswith("application/json") else 100
+                    buf.append(f"   📄 Response: {_snippet(response, limit)}...")
             else:
-                print(f"   ❌ Failed: Expected {expected_status}, got {response.status_code}")
-                print(f"   📄 Response: {response.text[:200]}")
-            
+                buf.append(f"   ❌ Failed: Expected {expected_status}, got {response.status_code}")
+                buf.append(f"   📄 Response: {_snippet(response, 200)}")
+
+            passed += success
             results.append((description, success))
-            
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
-            results.append((description, False))
-    
+
     # Summary
-    print("\n" + "=" * 50)
-    print("📊 Test Summary:")
-    
-    passed = sum(1 for _, success in results if success)
-    total = len(results)
-    
+    buf.append("\n" + "=" * 50)
+    buf.append("📊 Test Summary:")
+
     for description, success in results:
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"   {status} - {description}")
-    
-    print(f"\n🎯 Overall: {passed}/{total} tests passed")
-    
+        buf.append(f"   {status} - {description}")
+
+    buf.append(f"\n🎯 Overall: {passed}/{total} tests passed")
+
     if passed == total:
-        print("🎉 All tests passed! FastAPI server is working correctly.")
+        buf.append("🎉 All tests passed! FastAPI server is working correctly.")
     else:
-        print("⚠️  Some tests failed. Check the server configuration.")
-    
+        buf.append("⚠️  Some tests failed. Check the server configuration.")
+
+    sys.stdout.write("\n".join(buf) + "\n")
+
     return passed == total
 
-def test_slack_commands():
+async def test_slack_commands(async_client):
     """Test Slack command endpoints specifically"""
-    
-    print("\n🤖 Testing Slack Command Endpoints")
-    print("=" * 50)
-    
-    client = TestClient(app)
-    
-    # Test Slack command data
-    slack_command_data = {
-        "text": "help",
-        "channel_id": "test_channel",
-        "user_id": "test_user",
-        "team_id": "test_team"
-    }
-    
+
+    # Buffered like the endpoint report so concurrent execution doesn't
+    # interleave the two reports line by line.
+    buf = ["\n🤖 Testing Slack Command Endpoints", "=" * 50]
+
     try:
-        # Test POST to commands endpoint
-        response = client.post("/api/v1/slack/commands", data=slack_command_data)
-        
-        print(f"📋 Testing Slack Commands Endpoint")
-        print(f"   POST /api/v1/slack/commands")
-        
-        if response.status_code in [200, 401]:  # 401 is expected without proper Slack signature
-            print(f"   ✅ Endpoint accessible: {response.status_code}")
-            print(f"   📄 Response: {response.text[:200]}...")
-            return True
+        # Test POST to commands endpoint with the pre-encoded form body
+        response = await async_client.post(
+            "/api/v1/slack/commands", content=SLACK_BODY, headers=SLACK_HEADERS
+        )
+
+        buf.append("📋 Testing Slack Commands Endpoint")
+        buf.append("   POST /api/v1/slack/commands")
+
+        if response.status_code in OK_SLACK_STATUSES:
+            buf.append(f"   ✅ Endpoint accessible: {response.status_code}")
+            success = True
         else:
-            print(f"   ❌ Unexpected status: {response.status_code}")
-            print(f"   📄 Response: {response.text[:200]}...")
-            return False
-            
+            buf.append(f"   ❌ Unexpected status: {response.status_code}")
+            success = False
+        buf.append(f"   📄 Response: {response.text[:200]}...")
+
     except Exception as e:
-        print(f"   ❌ Error: {str(e)}")
-        return False
+        buf.append(f"   ❌ Error: {str(e)}")
+        success = False
+
+    sys.stdout.write("\n".join(buf) + "\n")
+    return success
+
+async def main():
+    """Run both test groups concurrently over one shared client."""
+    async with httpx.AsyncClient(
+        transport=_get_transport(), base_url="http://testserver"
+    ) as async_client:
+        async with asyncio.TaskGroup() as tg:
+            endpoints_task = tg.create_task(test_fastapi_endpoints(async_client))
+            slack_task = tg.create_task(test_slack_commands(async_client))
+    return endpoints_task.result() and slack_task.result()
 
 if __name__ == "__main__":
     try:
         print("🚀 Starting FastAPI TestClient Tests")
-        
-        # Test basic endpoints
-        basic_success = test_fastapi_endpoints()
-        
-        # Test Slack commands
-        slack_success = test_slack_commands()
-        
-        overall_success = basic_success and slack_success
+
+        # The Slack POST overlaps with the endpoint probes, so total wall
+        # time is the slower of the two groups rather than their sum.
+        overall_success = asyncio.run(main())
         
         if overall_success:
             print("\n🎉 All FastAPI tests completed successfully!")